@@ -4,9 +4,12 @@ Main application for transcript data editing and validation.
 """
 import os
 import sys
+import functools
+import importlib.util
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import logging
+import threading
 from pathlib import Path
 import tempfile
 import subprocess
@@ -15,8 +18,6 @@ import subprocess
 from utils.logger_setup import setup_logging
 from utils.config import config
 from utils.file_operations import save_transcript, load_transcript, load_course_data
-from utils.pdf_extractor import PDFExtractor
-from utils.validation_adapter import ValidationAdapter
 
 # Import data models
 from data.transcript_model import TranscriptModel
@@ -25,14 +26,86 @@ from data.semester_manager import SemesterManager
 from data.course_manager import CourseManager
 
 # Import UI components
-from ui.dialogs import CourseDataSelectorDialog, SemesterDetailsPanel
+from ui.dialogs import CourseDataSelectorDialog, FormatSelectionDialog, SemesterDetailsPanel
 from ui.course_lookup import CourseLookupDialog
-from ui.pdf_extraction_dialog import PDFExtractionDialog
-from ui.validation_report import ValidationReportDialog
 
 # Set up logging
 logger = logging.getLogger("transcript_editor")
 
+# Panels refreshed by TranscriptEditorApp.schedule_refresh() by default
+REFRESH_PANELS = ("student", "semesters", "semester_details", "courses")
+
+# File under config.cache_dir remembering where validator.py was last found
+VALIDATOR_PATH_CACHE_FILE = "validator_path.cache"
+
+def _compute_candidate_paths():
+    """Build the list of locations where validator.py may live outside sys.path."""
+    # Package root is this module's directory
+    package_root = Path(os.path.dirname(os.path.abspath(__file__)))
+    return [
+        package_root / "validator.py",                   # Same directory
+        package_root.parent / "validator.py",            # Parent directory
+        package_root.parent.parent / "validator.py",     # Grandparent directory
+        Path(sys.executable).parent / "validator.py",    # Python executable directory
+    ]
+
+# Candidate locations never change during a run, so build them once
+_POTENTIAL_VALIDATOR_PATHS = tuple(str(path) for path in _compute_candidate_paths())
+
+@functools.lru_cache(maxsize=1)
+def find_validator_path():
+    """
+    Find the path to validator.py.
+    
+    The result is memoized for the lifetime of the process and persisted to
+    the cache directory, so later launches only need to confirm that the
+    previously found file still exists.
+    
+    Returns:
+        Path to validator.py or None if it could not be found
+    """
+    cache_file = config.cache_dir / VALIDATOR_PATH_CACHE_FILE
+    try:
+        cached_path = Path(cache_file.read_text(encoding='utf-8').strip())
+        if cached_path.is_file():
+            logger.info(f"Using cached validator path: {cached_path}")
+            return cached_path
+    except OSError:
+        pass
+    
+    path = _search_validator_path()
+    if path:
+        try:
+            cache_file.write_text(str(path), encoding='utf-8')
+        except OSError as e:
+            logger.debug(f"Could not cache validator path: {e}")
+    return path
+
+def _search_validator_path():
+    """Search the standard locations for validator.py"""
+    # Let the import system walk sys.path first; this covers the local
+    # checkout as well as site-packages installs
+    for module_name in ["validator", "course-registration-validator.validator", "course_registration_validator.validator"]:
+        try:
+            spec = importlib.util.find_spec(module_name)
+        except (ImportError, ValueError, AttributeError):
+            continue
+        if spec and spec.origin:
+            path = Path(spec.origin)
+            if path.exists():
+                logger.info(f"Found validator module at: {path}")
+                return path
+    
+    # Fall back to probing locations that are not on sys.path
+    path_exists = os.path.exists
+    for path in _POTENTIAL_VALIDATOR_PATHS:
+        if path_exists(path):
+            logger.info(f"Found validator.py at: {path}")
+            return Path(path)
+            
+    logger.warning("validator.py not found in standard locations")
+    return None
+
 class TranscriptEditorApp(tk.Tk):
     """Main application for transcript data editing and validation."""
     
@@ -50,16 +123,17 @@ class TranscriptEditorApp(tk.Tk):
         self.student_manager = StudentManager(self.model)
         self.semester_manager = SemesterManager(self.model)
         self.course_manager = CourseManager(self.model)
-        self.pdf_extractor = PDFExtractor()
         
-        # Find validator path and create validation adapter
-        validator_path = self.find_validator_path()
-        if validator_path:
-            logger.info(f"Using validator path: {validator_path}")
-            self.validation_adapter = ValidationAdapter(str(validator_path))
-        else:
-            logger.warning("Using default validator path - may not work correctly")
-            self.validation_adapter = ValidationAdapter()
+        # PDF extractor and validation adapter pull in heavy dependencies.
+        # The extractor is created on first use, while validator discovery
+        # runs in the background so the window can paint immediately.
+        self.pdf_extractor = None
+        self.validation_adapter = None
+        self._validator_thread = threading.Thread(target=self._init_validation_adapter, daemon=True)
+        self._validator_thread.start()
+        
+        # Panels waiting for a coalesced refresh (see schedule_refresh)
+        self._pending_refresh = set()
         
         # Set up the UI
         self.create_menu()
@@ -70,6 +144,7 @@ class TranscriptEditorApp(tk.Tk):
         status_frame.pack(side=tk.BOTTOM, fill=tk.X)
         
         # Status bar
+        self._last_status = None
         self.status_var = tk.StringVar(value="Ready")
         self.status_bar = ttk.Label(status_frame, textvariable=self.status_var, relief=tk.SUNKEN, anchor=tk.W)
         self.status_bar.pack(side=tk.LEFT, fill=tk.X, expand=True)
@@ -89,56 +164,58 @@ class TranscriptEditorApp(tk.Tk):
     
     def find_validator_path(self):
         """Find the path to validator.py"""
-        # Get the package root directory
+        return find_validator_path()
+    
+    def get_pdf_extractor(self):
+        """Get the PDF extractor, creating it on first use."""
+        if self.pdf_extractor is None:
+            from utils.pdf_extractor import PDFExtractor
+            self.pdf_extractor = PDFExtractor()
+        return self.pdf_extractor
+    
+    def create_validation_adapter(self):
+        """Find validator.py and create a validation adapter for it."""
+        from utils.validation_adapter import ValidationAdapter
+        
+        validator_path = self.find_validator_path()
+        if validator_path:
+            logger.info(f"Using validator path: {validator_path}")
+            return ValidationAdapter(str(validator_path))
+        
+        logger.warning("Using default validator path - may not work correctly")
+        return ValidationAdapter()
+    
+    def _init_validation_adapter(self):
+        """Create the validation adapter on a background thread."""
         try:
-            import pkg_resources
-            package_root = Path(pkg_resources.resource_filename(__name__, ''))
-            logger.info(f"Using package root: {package_root}")
-        except (ImportError, pkg_resources.DistributionNotFound):
-            package_root = Path(os.path.dirname(os.path.abspath(__file__)))
-            logger.info(f"Using local directory as root: {package_root}")
-
-        # Attempt to find validator.py in several possible locations
-        potential_paths = [
-            package_root / "validator.py",                   # Same directory
-            package_root.parent / "validator.py",            # Parent directory
-            package_root.parent.parent / "validator.py",     # Grandparent directory
-            Path(sys.executable).parent / "validator.py",    # Python executable directory
-        ]
-        
-        # Also search in site-packages directories
-        site_packages = [Path(p) for p in sys.path if 'site-packages' in str(p)]
-        for site_dir in site_packages:
-            potential_paths.append(site_dir / "validator.py")
-            potential_paths.append(site_dir / "course-registration-validator" / "validator.py")
-            potential_paths.append(site_dir / "course_registration_validator" / "validator.py")
-        
-        # Try to find the validator file
-        for path in potential_paths:
-            if path.exists():
-                logger.info(f"Found validator.py at: {path}")
-                return path
-                
-        # If not found through paths, try to find it as a module
-        for module_name in ["validator", "course-registration-validator.validator", "course_registration_validator.validator"]:
-            try:
-                spec = importlib.util.find_spec(module_name)
-                if spec and spec.origin:
-                    path = Path(spec.origin)
-                    if path.exists():
-                        logger.info(f"Found validator module at: {path}")
-                        return path
-            except (ImportError, ValueError, AttributeError):
-                pass
-                
-        logger.warning("validator.py not found in standard locations")
-        return None
+            self.validation_adapter = self.create_validation_adapter()
+        except Exception as e:
+            logger.error(f"Failed to initialize validation adapter: {e}")
+    
+    def validator_initializing(self):
+        """
+        Check whether the validator is still being set up in the background.
+        
+        Shows a status message if it is, so callers can retry later.
+        """
+        if self._validator_thread.is_alive():
+            self.report_status("Initializing validator...")
+            return True
+        return False
+    
+    def get_validation_adapter(self):
+        """Get the validation adapter, creating it if background setup failed."""
+        if self.validation_adapter is None:
+            self._validator_thread.join()
+        if self.validation_adapter is None:
+            self.validation_adapter = self.create_validation_adapter()
+        return self.validation_adapter
     
     def check_course_data(self):
         """Check if course data is available and prompt to select if not."""
         logger.info(f"Checking course data: {config.current_course_data}")
         
-        if not config.current_course_data or not config.current_course_data.exists():
+        if not config.course_data_path_valid:
             # No course data available, show info dialog and then selector
             messagebox.showinfo(
                 "Course Data Required",
@@ -157,10 +234,10 @@ class TranscriptEditorApp(tk.Tk):
         """Load course data from the default file."""
         logger.info(f"Loading course data from {config.current_course_data}")
         
-        if config.current_course_data and config.current_course_data.exists():
+        if config.course_data_path_valid:
             course_data = load_course_data(str(config.current_course_data))
             self.course_manager.set_course_data(course_data)
-            logger.info(f"Loaded {len(course_data.get('all_courses', {}))} courses")
+            logger.info(f"Loaded {len(course_data.get('all_courses') or ())} courses")
         else:
             logger.warning("No course data file available")
             messagebox.showwarning(
@@ -171,7 +248,7 @@ class TranscriptEditorApp(tk.Tk):
     
     def update_course_data_display(self):
         """Update the display of current course data file."""
-        if config.current_course_data and config.current_course_data.exists():
+        if config.course_data_path_valid:
             self.course_data_var.set(f"Current Course Data: {config.current_course_data.name}")
         else:
             self.course_data_var.set("No course data file selected")
@@ -255,35 +332,53 @@ class TranscriptEditorApp(tk.Tk):
     
     def on_semester_change(self):
         """Handle semester selection change."""
-        # Update semester details panel
-        self.semester_details_panel.update_from_manager()
-        
-        # Update course panel
-        self.course_panel.update_course_list()
+        # Update semester details and course panels
+        self.schedule_refresh("semester_details", "courses")
     
     def on_semester_details_change(self):
         """Handle semester details change."""
-        # Update semester panel to reflect changes
-        self.semester_panel.update_listbox()
+        # Update semester list and course panels to reflect changes
+        self.schedule_refresh("semesters", "courses")
+    
+    def schedule_refresh(self, *panels):
+        """
+        Schedule a refresh of panels once Tk is idle.
+        
+        Requests made before the refresh runs are merged, so each panel is
+        redrawn at most once per batch of changes.
+        
+        Args:
+            panels: Names of panels to refresh ("student", "semesters",
+                "semester_details", "courses"); all panels if none given
+        """
+        if not self._pending_refresh:
+            self.after_idle(self._refresh_panels)
+        self._pending_refresh.update(panels or REFRESH_PANELS)
+    
+    def _refresh_panels(self):
+        """Refresh the panels requested through schedule_refresh."""
+        pending = self._pending_refresh
+        self._pending_refresh = set()
         
-        # Update course panel
-        self.course_panel.update_course_list()
+        if "student" in pending:
+            self.student_panel.load_from_manager()
+        if "semesters" in pending:
+            self.semester_panel.update_listbox()
+        if "semester_details" in pending:
+            self.semester_details_panel.update_from_manager()
+        if "courses" in pending:
+            self.course_panel.update_course_list()
     
     def new_transcript(self):
         """Create a new, empty transcript."""
-        if self.model.changed:
-            if not messagebox.askyesno("Unsaved Changes", 
-                                      "You have unsaved changes. Are you sure you want to start a new transcript?"):
-                return
+        if not self._confirm_discard("You have unsaved changes. Are you sure you want to start a new transcript?"):
+            return
         
         # Reset model
         self.model.reset()
         
         # Update UI
-        self.student_panel.load_from_manager()
-        self.semester_panel.update_listbox()
-        self.semester_details_panel.update_from_manager()
-        self.course_panel.update_course_list()
+        self.schedule_refresh()
         
         # Update window title
         self.title("Transcript Data Editor - New Transcript")
@@ -292,10 +387,8 @@ class TranscriptEditorApp(tk.Tk):
     
     def open_json(self):
         """Open transcript data from a JSON file."""
-        if self.model.changed:
-            if not messagebox.askyesno("Unsaved Changes", 
-                                      "You have unsaved changes. Are you sure you want to open a different file?"):
-                return
+        if not self._confirm_discard("You have unsaved changes. Are you sure you want to open a different file?"):
+            return
         
         # Open file dialog
         file_path = filedialog.askopenfilename(
@@ -311,10 +404,7 @@ class TranscriptEditorApp(tk.Tk):
             self.model.current_file_path = file_path
             
             # Update UI
-            self.student_panel.load_from_manager()
-            self.semester_panel.update_listbox()
-            self.semester_details_panel.update_from_manager()
-            self.course_panel.update_course_list()
+            self.schedule_refresh()
             
             # Update window title
             self.title(f"Transcript Data Editor - {os.path.basename(file_path)}")
@@ -360,10 +450,8 @@ class TranscriptEditorApp(tk.Tk):
     
     def try_extract_pdf(self):
         """Attempt to extract transcript data from a PDF file."""
-        if self.model.changed:
-            if not messagebox.askyesno("Unsaved Changes", 
-                                      "You have unsaved changes. Are you sure you want to extract data from a PDF?"):
-                return
+        if not self._confirm_discard("You have unsaved changes. Are you sure you want to extract data from a PDF?"):
+            return
         
         # Open file dialog
         file_path = filedialog.askopenfilename(
@@ -391,7 +479,7 @@ class TranscriptEditorApp(tk.Tk):
         
         # Extract text from PDF
         self.report_status(f"Extracting text from {os.path.basename(file_path)}...")
-        extracted_text = self.pdf_extractor.extract_text_from_pdf(file_path)
+        extracted_text = self.get_pdf_extractor().extract_text_from_pdf(file_path)
         
         if not extracted_text:
             messagebox.showerror("Error", "Failed to extract text from PDF")
@@ -399,6 +487,7 @@ class TranscriptEditorApp(tk.Tk):
             return
         
         # Show text for manual correction
+        from ui.pdf_extraction_dialog import PDFExtractionDialog
         PDFExtractionDialog(
             self, 
             extracted_text, 
@@ -414,7 +503,7 @@ class TranscriptEditorApp(tk.Tk):
             append_mode: Whether to append to current transcript or replace
         """
         # Process the corrected text
-        student_info, semesters, _ = self.pdf_extractor.process_pdf(
+        student_info, semesters, _ = self.get_pdf_extractor().process_pdf(
             None,  # No file path needed, using corrected text directly
             corrected_text
         )
@@ -426,29 +515,35 @@ class TranscriptEditorApp(tk.Tk):
         
         # Update model based on append_mode
         if not append_mode:
-            # Replace existing data
+            # Replace existing data in place so references to the list stay valid
             self.model.student_info = student_info
-            self.model.semesters = semesters
-            self.model.current_semester_index = 0 if semesters else 0
+            self.model.semesters[:] = semesters
+            self.model.current_semester_index = 0
         else:
             # Append semesters to existing data
+            new_len = len(self.model.semesters) + len(semesters)
             self.model.semesters.extend(semesters)
-            self.model.current_semester_index = len(self.model.semesters) - 1 if self.model.semesters else 0
+            self.model.current_semester_index = new_len - 1 if new_len else 0
+        
+        # Recount credit totals so extracted semesters follow the model's rules
+        self.model.recalculate_all_credits()
         
         self.model.set_changed()
         
         # Update UI
-        self.student_panel.load_from_manager()
-        self.semester_panel.update_listbox()
-        self.semester_details_panel.update_from_manager()
-        self.course_panel.update_course_list()
+        self.schedule_refresh()
         
         self.report_status(f"Extracted {len(semesters)} semesters from PDF")
     
     def validate_data(self):
         """Validate transcript data using validator."""
+        # Retry shortly if the validator is still being set up
+        if self.validator_initializing():
+            self.after(100, self.validate_data)
+            return
+        
         # First, check if we have a course data file
-        if not config.current_course_data or not config.current_course_data.exists():
+        if not config.course_data_path_valid:
             # Ask the user to select a course data file
             CourseDataSelectorDialog(self, self.on_course_data_selected_for_validation)
             return
@@ -458,8 +553,13 @@ class TranscriptEditorApp(tk.Tk):
     
     def quick_validate(self):
         """Perform a quick validation with the current course data and open the report."""
+        # Retry shortly if the validator is still being set up
+        if self.validator_initializing():
+            self.after(100, self.quick_validate)
+            return
+        
         # Check if we have a course data file
-        if not config.current_course_data or not config.current_course_data.exists():
+        if not config.course_data_path_valid:
             messagebox.showwarning(
                 "Course Data Required",
                 "A course data file is required for validation. Please select one."
@@ -518,26 +618,28 @@ class TranscriptEditorApp(tk.Tk):
     
     def perform_validation(self, auto_open_report=False):
         """Perform validation using the current course data."""
+        validation_adapter = self.get_validation_adapter()
+        
         # Make sure validator is initialized
-        if not self.validation_adapter.initialize_validator(str(config.current_course_data)):
+        if not validation_adapter.initialize_validator(str(config.current_course_data)):
             messagebox.showerror("Error", "Failed to initialize validator")
             return
         
         # Validate the current transcript
         self.report_status("Validating transcript...")
-        validation_results = self.validation_adapter.validate_transcript(
+        validation_results = validation_adapter.validate_transcript(
             self.model.student_info, self.model.semesters)
         
         if not validation_results:
             messagebox.showerror("Error", "Validation failed")
             return
         
+        # Count issues once; the count is reused whichever format is saved
+        invalid_count = sum(1 for r in validation_results if not r.get("is_valid", True))
+        
         # Get student ID for filename
         student_id = self.model.student_info.get("id", "unknown")
         
-        # Ask user for format
-        from ui.dialogs import FormatSelectionDialog
-        
         def save_report(format_type):
             if format_type is None:
                 return
@@ -552,27 +654,27 @@ class TranscriptEditorApp(tk.Tk):
             else:
                 # Text format (existing code)
                 report_path = config.reports_dir / f"validation_report_{student_id}.txt"
-                report = self.validation_adapter.generate_validation_report(
+                report = validation_adapter.generate_validation_report(
                     self.model.student_info, self.model.semesters, validation_results)
-                with open(report_path, 'w', encoding='utf-8') as file:
-                    file.write(report)
+                report_path.write_text(report, encoding='utf-8')
                 success = True
             
             if success:
-                invalid_count = len([r for r in validation_results if not r.get("is_valid", True)])
                 self.report_status(f"Validation complete - {invalid_count} issues found")
                 
                 if auto_open_report:
-                    # Open the file
+                    # Open the file without waiting for the viewer to exit
+                    report_path_str = os.fspath(report_path)
                     if sys.platform == 'win32':
-                        os.startfile(report_path)
+                        os.startfile(report_path_str)
                     elif sys.platform == 'darwin':
-                        subprocess.call(['open', str(report_path)])
+                        subprocess.Popen(['open', report_path_str], close_fds=True)
                     else:
-                        subprocess.call(['xdg-open', str(report_path)])
+                        subprocess.Popen(['xdg-open', report_path_str], close_fds=True)
             else:
                 messagebox.showerror("Error", f"Failed to save {format_type} report")
         
+        # Ask user for format
         FormatSelectionDialog(self, save_report)
     
     def select_course_data(self):
@@ -616,6 +718,18 @@ class TranscriptEditorApp(tk.Tk):
         """Show course lookup dialog."""
         CourseLookupDialog(self, self.course_manager)
     
+    def _confirm_discard(self, prompt):
+        """
+        Ask before discarding unsaved changes.
+        
+        Args:
+            prompt: Question to show if there are unsaved changes
+            
+        Returns:
+            True if there are no unsaved changes or the user confirmed
+        """
+        return (not self.model.changed) or messagebox.askyesno("Unsaved Changes", prompt)
+    
     def report_status(self, message):
         """
         Update status bar with a message.
@@ -623,14 +737,17 @@ class TranscriptEditorApp(tk.Tk):
         Args:
             message: Status message to display
         """
+        # Skip repeated messages to avoid redundant redraws
+        if message == self._last_status:
+            return
+        self._last_status = message
+        
         self.status_var.set(message)
-        logger.info(message)
+        logger.debug(message)
     
     def quit(self):
         """Quit the application."""
-        if self.model.changed:
-            if not messagebox.askyesno("Unsaved Changes", 
-                                      "You have unsaved changes. Are you sure you want to quit?"):
-                return
+        if not self._confirm_discard("You have unsaved changes. Are you sure you want to quit?"):
+            return
         
         super().quit()
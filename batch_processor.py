@@ -10,34 +10,31 @@ from tkinter import ttk, filedialog, messagebox
 import logging
 import threading
 import queue
+import functools
 from pathlib import Path
-import time
-import importlib.resources
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import importlib.util
-import pkg_resources
 
 # Set up logging first with basic configuration
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("batch_processor")
 
-# Find useful paths
+# Package root is this module's directory
+package_root = Path(os.path.dirname(os.path.abspath(__file__)))
+logger.info(f"Using package directory: {package_root}")
+
+# Use appdirs for proper locations in user directory, if installed
 try:
-    # First try to get the installed package location
-    package_root = Path(pkg_resources.resource_filename(__name__, ''))
-    logger.info(f"Using installed package at: {package_root}")
-    
-    # Use appdirs for proper locations in user directory
     import appdirs
+except ImportError:
+    appdirs = None
+
+if appdirs is not None:
     app_name = "course-registration-validator"
     app_author = "modern-research-group"
     
     user_data_dir = Path(appdirs.user_data_dir(app_name, app_author))
     user_data_dir.mkdir(exist_ok=True, parents=True)
-    
-except (ImportError, pkg_resources.DistributionNotFound):
-    # Fall back to the current directory if not installed as package
-    package_root = Path(os.path.dirname(os.path.abspath(__file__)))
-    logger.info(f"Using local directory: {package_root}")
 
 # Add package root to path for imports
 sys.path.append(str(package_root))
@@ -58,12 +55,215 @@ for potential_path in [
 from utils.logger_setup import setup_logging
 from utils.config import config
 from utils.validation_adapter import ValidationAdapter
-from utils.pdf_extractor import PDFExtractor
+from utils.pdf_extractor import PDFExtractor, PDF_READ_BUFFER_SIZE
 
 # Reinitialize logging with proper setup
 setup_logging()
 logger = logging.getLogger("batch_processor")
 
+# Interval in milliseconds between UI queue drains
+UI_QUEUE_POLL_MS = 50
+
+# Maximum number of worker events applied per UI queue drain
+UI_QUEUE_BATCH_SIZE = 64
+
+# Write buffer for validation reports, large enough for a report in one write
+REPORT_WRITE_BUFFER_SIZE = 64 * 1024
+
+# Files smaller than this can't hold a transcript and are rejected unparsed
+MIN_PDF_SIZE = 256
+
+# PDF readers accept the %PDF- header anywhere in the first 1 KiB
+PDF_HEADER_SEARCH_SIZE = 1024
+
+# Number of finished reports that may wait for the writer thread
+REPORT_QUEUE_SIZE = 32
+
+# Number of PDFs read into the OS page cache ahead of the pool workers
+PREFETCH_AHEAD = 2
+
+# Per-process state for pool workers, set up once by _init_worker
+_worker_extractor = None
+_worker_adapter = None
+
+def _init_worker(validator_path, course_data_path):
+    """
+    Initialize a batch worker process.
+    
+    Args:
+        validator_path: Path to the validator.py file
+        course_data_path: Path to the course data file
+    """
+    global _worker_extractor, _worker_adapter
+    _worker_extractor = PDFExtractor()
+    _worker_adapter = ValidationAdapter(validator_path)
+    _worker_adapter.initialize_validator(course_data_path)
+
+def _process_one(pdf_file):
+    """
+    Process a single PDF file in a worker process.
+    
+    The report is returned rather than written so that all output goes
+    through the parent's single writer thread.
+    
+    Args:
+        pdf_file: Path to the PDF file
+        
+    Returns:
+        Tuple of (success, messages, report) where messages is a list of
+        (message, color) tuples to append to the log and report is a
+        (file_name, text) tuple, or None if no report was generated
+    """
+    messages = []
+    file_name = os.path.basename(pdf_file)
+    
+    # Extract transcript data from PDF
+    with open(pdf_file, 'rb', buffering=PDF_READ_BUFFER_SIZE) as file:
+        # Reject empty, placeholder and non-PDF files before parsing them
+        if os.fstat(file.fileno()).st_size < MIN_PDF_SIZE:
+            messages.append((f"Skipping {file_name}: file is too small to be a transcript", None))
+            return False, messages, None
+        
+        if b'%PDF-' not in file.read(PDF_HEADER_SEARCH_SIZE):
+            messages.append((f"Skipping {file_name}: not a PDF file", None))
+            return False, messages, None
+        
+        file.seek(0)
+        student_info, semesters, _ = _worker_extractor.process_pdf(file)
+    
+    if not student_info or not semesters:
+        messages.append((f"Could not extract transcript data from {file_name}", None))
+        return False, messages, None
+    
+    # Validate the transcript
+    validation_results = _worker_adapter.validate_transcript(
+        student_info, semesters)
+    
+    if not validation_results:
+        messages.append((f"Failed to validate transcript from {file_name}", None))
+        return False, messages, None
+    
+    # Generate report
+    student_id = student_info.get("id", "unknown")
+    
+    # Use filename if student ID is unknown
+    if student_id == "unknown":
+        student_id = os.path.splitext(file_name)[0]
+    
+    # Count invalid courses; ValidationAdapter always sets both keys
+    invalid_count = sum(1 for r in validation_results
+                        if not r["is_valid"] and r["course_code"] != "CREDIT_LIMIT")
+    
+    # Generate report
+    report = _worker_adapter.generate_validation_report(
+        student_info, semesters, validation_results)
+    
+    # Log invalid course count if any
+    if invalid_count > 0:
+        messages.append((f"Student ID: {student_id} has {invalid_count} invalid courses", "red"))
+    
+    return True, messages, (f"validation_report_{student_id}.txt", report)
+
+def _file_size(path):
+    """
+    Get a file's size, treating unreadable files as empty.
+    
+    Args:
+        path: Path to the file
+        
+    Returns:
+        Size in bytes
+    """
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+def _scan_pdfs(directory, subdirectories=None):
+    """
+    Yield PDF files directly inside a directory.
+    
+    Args:
+        directory: Directory to scan
+        subdirectories: Optional list that collects subdirectory paths
+        
+    Yields:
+        PDF file paths
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            name = entry.name
+            if name[-4:].lower() == '.pdf' and entry.is_file():
+                yield entry.path
+            elif subdirectories is not None and entry.is_dir(follow_symlinks=False):
+                subdirectories.append(entry.path)
+
+def _scan_pdfs_recursive(directory):
+    """
+    Yield PDF files in a directory tree, top-down like os.walk.
+    
+    Unreadable directories are skipped and symlinked directories are not
+    followed, as with os.walk.
+    
+    Args:
+        directory: Root directory to scan
+        
+    Yields:
+        PDF file paths
+    """
+    subdirectories = []
+    try:
+        yield from _scan_pdfs(directory, subdirectories)
+    except OSError as e:
+        logger.debug(f"Skipping unreadable directory {directory}: {e}")
+        return
+    
+    for subdirectory in subdirectories:
+        yield from _scan_pdfs_recursive(subdirectory)
+
+@functools.lru_cache(maxsize=1)
+def _discover_validator_path():
+    """
+    Find the path to validator.py, searching only once per process.
+    
+    Returns:
+        Path to validator.py, or None if it can't be found
+    """
+    # Attempt to find validator.py in several possible locations
+    potential_paths = [
+        package_root / "validator.py",                   # Same directory
+        package_root.parent / "validator.py",            # Parent directory
+        package_root.parent.parent / "validator.py",     # Grandparent directory
+        Path(sys.executable).parent / "validator.py",    # Python executable directory
+    ]
+    
+    # Also search in site-packages directories
+    for site_dir in sys.path:
+        if 'site-packages' in site_dir:
+            potential_paths.append(Path(site_dir, "validator.py"))
+            potential_paths.append(Path(site_dir, "course-registration-validator", "validator.py"))
+    
+    # Try to find the validator file, checking each location only once
+    for path in dict.fromkeys(potential_paths):
+        if path.is_file():
+            logger.info(f"Found validator.py at: {path}")
+            return path
+    
+    # If not found through paths, try to find it as a module
+    for module_name in ["validator", "course-registration-validator.validator"]:
+        try:
+            spec = importlib.util.find_spec(module_name)
+            if spec and spec.origin:
+                path = Path(spec.origin)
+                if path.exists():
+                    logger.info(f"Found validator module at: {path}")
+                    return path
+        except (ImportError, ValueError, AttributeError):
+            pass
+    
+    logger.warning("validator.py not found in standard locations")
+    return None
+
 class BatchProcessorApp(tk.Tk):
     """GUI application for batch processing PDF transcripts."""
     
@@ -74,9 +274,6 @@ class BatchProcessorApp(tk.Tk):
         self.geometry("1200x920")
         self.minsize(1150, 870)
         
-        # Initialize components
-        self.pdf_extractor = PDFExtractor()
-        
         # Initialize the validation adapter
         # Try to find validator.py in several possible locations
         validator_path = self.find_validator_path()
@@ -91,8 +288,15 @@ class BatchProcessorApp(tk.Tk):
         self.course_data_path = None
         self.pdf_directory = None
         self.output_directory = None
-        self.processing_queue = queue.Queue()
         self.stop_requested = False
+        self._pdf_files_cache = None
+        self._last_progress = (0, 0, 0)
+        
+        # Events posted by the processing thread, applied on the Tk thread
+        self._ui_queue = queue.SimpleQueue()
+        
+        # Color tags already configured on the log widget
+        self._log_tags = set()
         
         # Create UI
         self.create_widgets()
@@ -106,6 +310,9 @@ class BatchProcessorApp(tk.Tk):
         self.status_bar = ttk.Label(status_frame, textvariable=self.status_var, relief=tk.SUNKEN, anchor=tk.W)
         self.status_bar.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
+        # Start applying worker events to the UI
+        self.after(UI_QUEUE_POLL_MS, self._drain_ui_queue)
+        
         # Dedication to Raphin P.
         dedication_label = ttk.Label(status_frame, 
                                   text="Created for Raphin P.",
@@ -117,40 +324,7 @@ class BatchProcessorApp(tk.Tk):
     
     def find_validator_path(self):
         """Find the path to validator.py"""
-        # Attempt to find validator.py in several possible locations
-        potential_paths = [
-            package_root / "validator.py",                   # Same directory
-            package_root.parent / "validator.py",            # Parent directory
-            package_root.parent.parent / "validator.py",     # Grandparent directory
-            Path(sys.executable).parent / "validator.py",    # Python executable directory
-        ]
-        
-        # Also search in site-packages directories
-        site_packages = [Path(p) for p in sys.path if 'site-packages' in str(p)]
-        for site_dir in site_packages:
-            potential_paths.append(site_dir / "validator.py")
-            potential_paths.append(site_dir / "course-registration-validator" / "validator.py")
-        
-        # Try to find the validator file
-        for path in potential_paths:
-            if path.exists():
-                logger.info(f"Found validator.py at: {path}")
-                return path
-                
-        # If not found through paths, try to find it as a module
-        for module_name in ["validator", "course-registration-validator.validator"]:
-            try:
-                spec = importlib.util.find_spec(module_name)
-                if spec and spec.origin:
-                    path = Path(spec.origin)
-                    if path.exists():
-                        logger.info(f"Found validator module at: {path}")
-                        return path
-            except (ImportError, ValueError, AttributeError):
-                pass
-                
-        logger.warning("validator.py not found in standard locations")
-        return None
+        return _discover_validator_path()
     
     def create_widgets(self):
         """Create the GUI widgets."""
@@ -209,6 +383,7 @@ class BatchProcessorApp(tk.Tk):
         pdf_row.pack(fill=tk.X, expand=True)
         
         self.pdf_dir_var = tk.StringVar()
+        self.pdf_dir_var.trace_add('write', self.invalidate_pdf_files_cache)
         ttk.Label(pdf_row, text="PDF Directory:").pack(side=tk.LEFT, padx=(0, 5))
         ttk.Entry(pdf_row, textvariable=self.pdf_dir_var, width=50).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
         ttk.Button(pdf_row, text="Browse...", command=self.select_pdf_directory).pack(side=tk.LEFT)
@@ -312,7 +487,7 @@ class BatchProcessorApp(tk.Tk):
             self.report_status(f"PDF directory selected: {directory}")
             
             # Count PDF files
-            pdfs = self.count_pdf_files(directory, self.recursion_var.get())
+            pdfs = self.get_pdf_files(directory, self.recursion_var.get())
             self.total_files_var.set(str(len(pdfs)))
     
     def select_output_directory(self):
@@ -326,19 +501,29 @@ class BatchProcessorApp(tk.Tk):
     
     def count_pdf_files(self, directory, recursive=False):
         """Count PDF files in directory."""
-        pdf_files = []
-        
         if recursive:
-            for root, _, files in os.walk(directory):
-                for file in files:
-                    if file.lower().endswith('.pdf'):
-                        pdf_files.append(os.path.join(root, file))
-        else:
-            for file in os.listdir(directory):
-                if file.lower().endswith('.pdf'):
-                    pdf_files.append(os.path.join(directory, file))
+            return list(_scan_pdfs_recursive(directory))
+        return list(_scan_pdfs(directory))
+    
+    def get_pdf_files(self, directory, recursive=False):
+        """
+        Get PDF files in directory, reusing the last scan when possible.
         
-        return pdf_files
+        Args:
+            directory: Directory to scan
+            recursive: Whether to include subdirectories
+            
+        Returns:
+            List of PDF file paths
+        """
+        key = (directory, recursive)
+        if self._pdf_files_cache is None or self._pdf_files_cache[0] != key:
+            self._pdf_files_cache = (key, self.count_pdf_files(directory, recursive))
+        return self._pdf_files_cache[1]
+    
+    def invalidate_pdf_files_cache(self, *args):
+        """Forget the last PDF directory scan."""
+        self._pdf_files_cache = None
     
     def start_processing(self):
         """Start processing PDF files."""
@@ -360,8 +545,10 @@ class BatchProcessorApp(tk.Tk):
             messagebox.showerror("Error", "Failed to initialize validator with selected course data")
             return
         
-        # Get PDF files
-        pdf_files = self.count_pdf_files(self.pdf_directory, self.recursion_var.get())
+        # Rescan so files added or removed since the directory was selected
+        # are picked up; the fresh list also replaces the cached one
+        self.invalidate_pdf_files_cache()
+        pdf_files = self.get_pdf_files(self.pdf_directory, self.recursion_var.get())
         
         if not pdf_files:
             messagebox.showwarning("Warning", "No PDF files found in the selected directory")
@@ -374,6 +561,7 @@ class BatchProcessorApp(tk.Tk):
         self.failed_var.set("0")
         self.progress_bar["maximum"] = len(pdf_files)
         self.progress_bar["value"] = 0
+        self._last_progress = (0, 0, 0)
         
         # Clear log
         self.log_text.delete(1.0, tk.END)
@@ -385,68 +573,235 @@ class BatchProcessorApp(tk.Tk):
         # Reset stop flag
         self.stop_requested = False
         
-        # Add files to queue
-        for pdf_file in pdf_files:
-            self.processing_queue.put(pdf_file)
-        
         # Start processing thread
-        processing_thread = threading.Thread(target=self.process_files_worker)
+        processing_thread = threading.Thread(target=self.process_files_worker, args=(pdf_files,))
         processing_thread.daemon = True
         processing_thread.start()
         
         self.report_status(f"Started processing {len(pdf_files)} PDF files")
     
-    def process_files_worker(self):
-        """Worker function for processing files in a thread."""
+    def process_files_worker(self, pdf_files):
+        """
+        Worker function that fans files out to a process pool.
+        
+        Runs in a background thread; UI updates are posted to _ui_queue
+        and applied on the main thread by _drain_ui_queue.
+        
+        Args:
+            pdf_files: List of PDF file paths to process
+        """
+        post = self._ui_queue.put
+        
+        # Largest files first, so no big PDF is left to run alone at the end
+        pdf_files = sorted(pdf_files, key=_file_size, reverse=True)
+        
+        max_workers = os.cpu_count() or 1
+        post(("log", f"Processing with {max_workers} worker processes", None))
+        
+        # Warm the page cache for upcoming files while workers are busy
+        prefetch_slots = threading.Semaphore(max_workers + PREFETCH_AHEAD)
+        prefetch_finished = threading.Event()
+        prefetch_thread = threading.Thread(target=self._prefetch_pdfs,
+                                           args=(pdf_files, prefetch_slots, prefetch_finished))
+        prefetch_thread.daemon = True
+        prefetch_thread.start()
+        
+        # Write reports and count outcomes from one thread so workers never
+        # touch the output directory and a file only counts once its report is saved
+        report_queue = queue.Queue(maxsize=REPORT_QUEUE_SIZE)
+        writer_thread = threading.Thread(target=self._write_reports,
+                                         args=(report_queue, self.output_directory))
+        writer_thread.daemon = True
+        writer_thread.start()
+        
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 initializer=_init_worker,
+                                 initargs=(self.validation_adapter.validator_path, self.course_data_path)) as executor:
+            futures = {executor.submit(_process_one, pdf_file): pdf_file
+                       for pdf_file in pdf_files}
+            
+            stopping = False
+            for future in as_completed(futures):
+                # Files dropped by a stop request have no result to record
+                if future.cancelled():
+                    continue
+                
+                pdf_file = futures[future]
+                file_name = os.path.basename(pdf_file)
+                post(("file", pdf_file))
+                prefetch_slots.release()
+                
+                try:
+                    result, messages, report = future.result()
+                    
+                    for message, color in messages:
+                        post(("log", message, color))
+                    
+                except Exception as e:
+                    # None marks a failure that has already been logged
+                    result, report = None, None
+                    post(("log", f"✗ Error processing {file_name}: {str(e)}", None))
+                    logger.error(f"Error processing {pdf_file}: {e}")
+                
+                report_queue.put((file_name, result, report))
+                
+                if self.stop_requested and not stopping:
+                    # Drop files that haven't started; the loop keeps going
+                    # so files already running are still recorded
+                    stopping = True
+                    for pending in futures:
+                        pending.cancel()
+        
+        # Wake the prefetcher if it is waiting for a slot so it can exit
+        prefetch_finished.set()
+        prefetch_slots.release()
+        
+        # Let the writer finish the queued reports before reporting completion
+        report_queue.put(None)
+        writer_thread.join()
+        
+        # Processing complete or stopped
+        post(("done", self.stop_requested))
+    
+    def _write_reports(self, report_queue, output_directory):
+        """
+        Write reports and count file outcomes until a None sentinel arrives.
+        
+        A file only counts as successful once its report has been written.
+        
+        Args:
+            report_queue: Queue of (file_name, result, report) tuples, where
+                result is None for errors that were already logged and report
+                is a (file_name, text) tuple or None
+            output_directory: Directory to save the reports in
+        """
+        post = self._ui_queue.put
         processed = 0
         successful = 0
         failed = 0
         
-        while not self.processing_queue.empty() and not self.stop_requested:
-            # Get next file
-            pdf_file = self.processing_queue.get()
+        while True:
+            outcome = report_queue.get()
+            if outcome is None:
+                return
             
-            # Update UI
-            self.current_file_var.set(pdf_file)
-            self.log_append(f"Processing: {pdf_file}")
+            file_name, result, report = outcome
+            if report is not None and not self._write_report(report, output_directory):
+                result = False
             
-            try:
-                # Process the file
-                result = self.process_pdf_file(pdf_file)
-                
-                if result:
-                    successful += 1
-                    self.log_append(f"✓ Succeeded: {os.path.basename(pdf_file)}")
-                else:
-                    failed += 1
-                    self.log_append(f"✗ Failed: {os.path.basename(pdf_file)}")
-                
-            except Exception as e:
+            if result:
+                successful += 1
+                post(("log", f"✓ Succeeded: {file_name}", None))
+            else:
                 failed += 1
-                self.log_append(f"✗ Error processing {os.path.basename(pdf_file)}: {str(e)}")
-                logger.error(f"Error processing {pdf_file}: {e}")
+                if result is not None:
+                    post(("log", f"✗ Failed: {file_name}", None))
             
             # Update counters
             processed += 1
+            post(("progress", processed, successful, failed))
+    
+    def _write_report(self, report, output_directory):
+        """
+        Write a single validation report.
+        
+        Args:
+            report: (file_name, text) tuple
+            output_directory: Directory to save the report in
             
-            # Update UI on main thread
-            self.after(0, self.update_progress, processed, successful, failed)
+        Returns:
+            True if the report was written, False otherwise
+        """
+        file_name, text = report
+        output_path = os.path.join(output_directory, file_name)
+        
+        try:
+            with open(output_path, 'w', encoding='utf-8', buffering=REPORT_WRITE_BUFFER_SIZE) as file:
+                file.write(text)
+            return True
+        except OSError as e:
+            self._ui_queue.put(("log", f"✗ Could not write {file_name}: {e}", "red"))
+            logger.error(f"Error writing report {output_path}: {e}")
+            return False
+    
+    def _prefetch_pdfs(self, pdf_files, slots, finished):
+        """
+        Read PDFs ahead of the pool workers so they open from the page cache.
+        
+        Args:
+            pdf_files: PDF file paths in submission order
+            slots: Semaphore released once per completed file
+            finished: Event set when processing is over
+        """
+        buffer = bytearray(PDF_READ_BUFFER_SIZE)
+        
+        for pdf_file in pdf_files:
+            slots.acquire()
+            if finished.is_set():
+                return
             
-            # Give UI time to update
-            time.sleep(0.1)
+            try:
+                with open(pdf_file, 'rb', buffering=0) as file:
+                    while file.readinto(buffer):
+                        pass
+            except OSError as e:
+                # The worker reports unreadable files itself
+                logger.debug(f"Could not prefetch {pdf_file}: {e}")
+    
+    def _drain_ui_queue(self):
+        """Apply pending worker events to the UI and reschedule the drain."""
+        self.after(UI_QUEUE_POLL_MS, self._drain_ui_queue)
         
-        # Processing complete or stopped
-        if self.stop_requested:
-            self.after(0, self.processing_stopped)
-        else:
-            self.after(0, self.processing_complete)
+        log_entries = []
+        progress = None
+        current_file = None
+        done = None
+        
+        for _ in range(UI_QUEUE_BATCH_SIZE):
+            try:
+                event = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            
+            kind = event[0]
+            if kind == "log":
+                log_entries.append(event[1:])
+            elif kind == "file":
+                current_file = event[1]
+            elif kind == "progress":
+                progress = event[1:]
+            elif kind == "done":
+                done = event[1]
+        
+        if log_entries:
+            self.log_extend(log_entries)
+        
+        # Only the latest values matter, so set them once per drain
+        if current_file is not None:
+            self.current_file_var.set(current_file)
+        
+        if progress is not None:
+            self.update_progress(*progress)
+        
+        if done is not None:
+            if done:
+                self.processing_stopped()
+            else:
+                self.processing_complete()
     
     def update_progress(self, processed, successful, failed):
-        """Update progress indicators."""
-        self.processed_var.set(str(processed))
-        self.success_var.set(str(successful))
-        self.failed_var.set(str(failed))
-        self.progress_bar["value"] = processed
+        """Update progress indicators that changed since the last update."""
+        last_processed, last_successful, last_failed = self._last_progress
+        
+        if processed != last_processed:
+            self.processed_var.set(str(processed))
+            self.progress_bar["value"] = processed
+        if successful != last_successful:
+            self.success_var.set(str(successful))
+        if failed != last_failed:
+            self.failed_var.set(str(failed))
+        
+        self._last_progress = (processed, successful, failed)
     
     def processing_complete(self):
         """Handle completion of processing."""
@@ -481,63 +836,6 @@ class BatchProcessorApp(tk.Tk):
         self.stop_requested = True
         self.report_status("Stopping processing...")
     
-    def process_pdf_file(self, pdf_file):
-        """
-        Process a single PDF file.
-        
-        Args:
-            pdf_file: Path to the PDF file
-            
-        Returns:
-            True if successful, False otherwise
-        """
-        try:
-            # Extract transcript data from PDF
-            student_info, semesters, _ = self.pdf_extractor.process_pdf(pdf_file)
-            
-            if not student_info or not semesters:
-                self.log_append(f"Could not extract transcript data from {os.path.basename(pdf_file)}")
-                return False
-            
-            # Validate the transcript
-            validation_results = self.validation_adapter.validate_transcript(
-                student_info, semesters)
-            
-            if not validation_results:
-                self.log_append(f"Failed to validate transcript from {os.path.basename(pdf_file)}")
-                return False
-            
-            # Generate report
-            student_id = student_info.get("id", "unknown")
-            
-            # Use filename if student ID is unknown
-            if student_id == "unknown":
-                student_id = os.path.splitext(os.path.basename(pdf_file))[0]
-            
-            # Count invalid courses
-            invalid_results = [r for r in validation_results if not r.get("is_valid", True) and r.get("course_code") != "CREDIT_LIMIT"]
-            invalid_count = len(invalid_results)
-            
-            # Generate report
-            report = self.validation_adapter.generate_validation_report(
-                student_info, semesters, validation_results)
-            
-            # Save report to output directory
-            output_path = os.path.join(self.output_directory, f"validation_report_{student_id}.txt")
-            
-            with open(output_path, 'w', encoding='utf-8') as file:
-                file.write(report)
-            
-            # Log invalid course count if any
-            if invalid_count > 0:
-                self.log_append(f"Student ID: {student_id} has {invalid_count} invalid courses", color="red")
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error processing {pdf_file}: {e}")
-            raise
-    
     def log_append(self, message, color=None):
         """
         Append message to log.
@@ -546,24 +844,39 @@ class BatchProcessorApp(tk.Tk):
             message: Message to append
             color: Optional text color (e.g., "red", "green")
         """
-        self.log_text.insert(tk.END, message + "\n")
+        self.log_extend(((message, color),))
+    
+    def log_extend(self, entries):
+        """
+        Append several messages to the log with a single insert.
         
-        # Apply color tag if specified
-        if color:
-            end_pos = self.log_text.index(tk.END)
-            start_pos = f"{float(end_pos) - 1 - len(message)/10000} linestart"
-            end_pos = f"{float(end_pos) - 1 + 0.0} lineend"
-            
-            # Create a tag for this color if it doesn't exist
-            tag_name = f"color_{color}"
-            if tag_name not in self.log_text.tag_names():
-                self.log_text.tag_configure(tag_name, foreground=color)
-            
-            # Apply the tag
-            self.log_text.tag_add(tag_name, start_pos, end_pos)
+        Args:
+            entries: Iterable of (message, color) tuples; color may be None
+        """
+        chunks = []
+        for message, color in entries:
+            chunks.append(message + "\n")
+            chunks.append(self._log_color_tag(color) if color else ())
         
+        self.log_text.insert(tk.END, *chunks)
         self.log_text.see(tk.END)
     
+    def _log_color_tag(self, color):
+        """
+        Get the log text tag for a color, creating it on first use.
+        
+        Args:
+            color: Text color (e.g., "red", "green")
+            
+        Returns:
+            Tag name
+        """
+        tag_name = f"color_{color}"
+        if tag_name not in self._log_tags:
+            self.log_text.tag_configure(tag_name, foreground=color)
+            self._log_tags.add(tag_name)
+        return tag_name
+    
     def report_status(self, message):
         """Update status bar."""
         self.status_var.set(message)
@@ -9,6 +9,18 @@ from tkinter import ttk, messagebox
 
 logger = logging.getLogger("course_manager")
 
+# Leading credit count in course data credits like "3(3-0-6)"
+_CREDITS_RE = re.compile(r'(\d+)\(')
+
+# Grades offered in the course dialog
+_GRADES = ("A", "B+", "B", "C+", "C", "D+", "D", "F", "W", "P", "N")
+
+# Course treeview columns
+_COURSE_COLUMNS = ("code", "name", "grade", "credits")
+
+# Delay after the last keystroke in the course code field before looking it up
+_COURSE_LOOKUP_DELAY_MS = 150
+
 class CourseManager:
     """
     Manages course data in the transcript.
@@ -24,8 +36,7 @@ class CourseManager:
             course_data: Dictionary with course information
         """
         self.model = model
-        self.course_data = course_data or {}
-        self.all_courses = self.course_data.get("all_courses", {})
+        self.set_course_data(course_data)
     
     def set_course_data(self, course_data):
         """
@@ -36,6 +47,17 @@ class CourseManager:
         """
         self.course_data = course_data or {}
         self.all_courses = self.course_data.get("all_courses", {})
+        self._display_cache = {}
+        
+        # Index by normalized code so stray spaces or case don't miss a course
+        self._norm_courses = {code.strip().upper(): course for code, course in self.all_courses.items()}
+        
+        # Parse credit counts from formats like "3(3-0-6)" once, not per lookup
+        self._course_credits = {}
+        for code, course in self._norm_courses.items():
+            credit_match = _CREDITS_RE.match(str(course.get("credits", "")))
+            if credit_match:
+                self._course_credits[code] = credit_match.group(1)
     
     def get_course_info(self, course_code):
         """
@@ -47,7 +69,40 @@ class CourseManager:
         Returns:
             Dictionary with course information or None
         """
-        return self.all_courses.get(course_code)
+        if not course_code:
+            return None
+        return self._norm_courses.get(course_code.strip().upper())
+    
+    def get_course_display(self, course_code):
+        """
+        Get a course code labelled with its name, e.g. for prerequisite lists.
+        
+        Args:
+            course_code: Course code to look up
+            
+        Returns:
+            "code (name)" if the course is known, otherwise the code itself
+        """
+        display = self._display_cache.get(course_code)
+        if display is None:
+            course = self.get_course_info(course_code)
+            display = f"{course_code} ({course.get('name', '')})" if course else course_code
+            self._display_cache[course_code] = display
+        return display
+    
+    def get_course_credits(self, course_code):
+        """
+        Get the credit count of a course from the course data.
+        
+        Args:
+            course_code: Course code to look up
+            
+        Returns:
+            Credit count as a string, or None if unknown
+        """
+        if not course_code:
+            return None
+        return self._course_credits.get(course_code.strip().upper())
     
     def get_courses_for_semester(self, semester_index):
         """
@@ -59,8 +114,9 @@ class CourseManager:
         Returns:
             List of course dictionaries
         """
-        if semester_index < len(self.model.semesters):
-            return self.model.semesters[semester_index].get("courses", [])
+        semesters = self.model.semesters
+        if semester_index < len(semesters):
+            return semesters[semester_index].get("courses", [])
         return []
     
     def add_course(self, semester_index, course_data):
@@ -115,25 +171,26 @@ class CourseManager:
         Returns:
             Number of courses moved
         """
-        if src_semester_index >= len(self.model.semesters) or dst_semester_index >= len(self.model.semesters):
+        semesters = self.model.semesters
+        num_semesters = len(semesters)
+        if src_semester_index >= num_semesters or dst_semester_index >= num_semesters:
             return 0
         
         # Get source and destination semesters
-        src_semester = self.model.semesters[src_semester_index]
-        dst_semester = self.model.semesters[dst_semester_index]
+        src_semester = semesters[src_semester_index]
+        dst_semester = semesters[dst_semester_index]
         
-        # Sort indices in reverse order to avoid shifting problems when removing
-        sorted_indices = sorted(course_indices, reverse=True)
+        # Partition the source courses in one pass instead of popping each
+        # index, which would shift the rest of the list every time
+        src_courses = src_semester.get("courses", [])
+        move_set = {idx for idx in course_indices if 0 <= idx < len(src_courses)}
+        moved_courses = [src_courses[idx] for idx in sorted(move_set)]
         
-        # Move the courses
-        moved_courses = []
-        for idx in sorted_indices:
-            if idx < len(src_semester.get("courses", [])):
-                moved_courses.append(src_semester["courses"].pop(idx))
+        if moved_courses:
+            src_courses[:] = [course for idx, course in enumerate(src_courses) if idx not in move_set]
         
         # Add to destination semester in original order
-        for course in reversed(moved_courses):
-            dst_semester["courses"].append(course)
+        dst_semester["courses"].extend(moved_courses)
         
         # Recalculate credits for both semesters
         self.model.recalculate_semester_credits(src_semester_index)
@@ -172,6 +229,13 @@ class CoursePanel(ttk.LabelFrame):
         self.manager = manager
         self.semester_manager = semester_manager
         
+        # Treeview item ids and the values they show, in row order
+        self._row_iids = []
+        self._row_values = []
+        
+        # Treeview item id to course index, so selections map without Treeview.index()
+        self._iid_to_idx = {}
+        
         # Create UI elements
         self.create_widgets()
         
@@ -184,8 +248,7 @@ class CoursePanel(ttk.LabelFrame):
         tree_frame = ttk.Frame(self)
         tree_frame.pack(fill=tk.BOTH, expand=True)
         
-        columns = ("code", "name", "grade", "credits")
-        self.courses_tree = ttk.Treeview(tree_frame, columns=columns, show="headings", height=10, selectmode="extended")
+        self.courses_tree = ttk.Treeview(tree_frame, columns=_COURSE_COLUMNS, show="headings", height=10, selectmode="extended")
         
         # Define headings
         self.courses_tree.heading("code", text="Course Code")
@@ -215,25 +278,55 @@ class CoursePanel(ttk.LabelFrame):
         ttk.Button(button_frame, text="Move Course", command=self.move_course_to_semester).pack(side=tk.LEFT, padx=2)
     
     def update_course_list(self):
-        """Update the course treeview with data from the current semester."""
-        # Clear the treeview
-        for item in self.courses_tree.get_children():
-            self.courses_tree.delete(item)
+        """
+        Update the course treeview with data from the current semester.
         
+        Only rows whose values changed are touched, so refreshing an
+        unchanged or slightly edited semester costs few Tk calls.
+        """
         # Get current semester index
         semester_index = self.semester_manager.get_current_semester_index()
         
         # Get courses for the current semester
         courses = self.manager.get_courses_for_semester(semester_index)
         
-        # Add courses to the treeview
-        for course in courses:
-            self.courses_tree.insert("", tk.END, values=(
-                course.get("code", ""),
-                course.get("name", ""),
-                course.get("grade", ""),
-                course.get("credits", "")
-            ))
+        new_values = [(
+            course.get("code", ""),
+            course.get("name", ""),
+            course.get("grade", ""),
+            course.get("credits", "")
+        ) for course in courses]
+        
+        tree = self.courses_tree
+        row_iids = self._row_iids
+        
+        # Rewrite rows that show a different course now, dropping them
+        # from the selection since they no longer refer to the same course
+        changed = []
+        for iid, old, new in zip(row_iids, self._row_values, new_values):
+            if old != new:
+                tree.item(iid, values=new)
+                changed.append(iid)
+        
+        if changed:
+            tree.selection_remove(*changed)
+        
+        # Remove surplus rows or add missing ones
+        if len(row_iids) > len(new_values):
+            surplus = row_iids[len(new_values):]
+            tree.delete(*surplus)
+            for iid in surplus:
+                del self._iid_to_idx[iid]
+            del row_iids[len(new_values):]
+        else:
+            insert = tree.insert
+            iid_to_idx = self._iid_to_idx
+            for values in new_values[len(row_iids):]:
+                iid = insert("", tk.END, values=values)
+                iid_to_idx[iid] = len(row_iids)
+                row_iids.append(iid)
+        
+        self._row_values = new_values
     
     def add_course(self):
         """Add a new course to the current semester."""
@@ -254,7 +347,7 @@ class CoursePanel(ttk.LabelFrame):
         
         # Get selected course index
         item_id = selection[0]
-        course_index = self.courses_tree.index(item_id)
+        course_index = self._iid_to_idx[item_id]
         
         # Open course dialog with current data
         self.open_course_dialog(course_index)
@@ -270,7 +363,7 @@ class CoursePanel(ttk.LabelFrame):
         if messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this course?"):
             # Get selected course index
             item_id = selection[0]
-            course_index = self.courses_tree.index(item_id)
+            course_index = self._iid_to_idx[item_id]
             
             # Delete course
             semester_index = self.semester_manager.get_current_semester_index()
@@ -287,15 +380,29 @@ class CoursePanel(ttk.LabelFrame):
             return
         
         # Get the selected course indices
-        selected_indices = [self.courses_tree.index(item_id) for item_id in selection]
+        selected_indices = [self._iid_to_idx[item_id] for item_id in selection]
         
         # Get the current semester index
         src_semester_index = self.semester_manager.get_current_semester_index()
         
+        # Semesters other than the current one are possible targets
+        semesters = self.semester_manager.get_semesters()
+        # To map listbox indices to actual semester indices
+        target_semester_indices = [i for i in range(len(semesters)) if i != src_semester_index]
+        
+        # With only one possible target, confirm directly instead of opening the picker
+        if len(target_semester_indices) == 1:
+            target_index = target_semester_indices[0]
+            num_selected = len(selected_indices)
+            if messagebox.askyesno("Confirm Move",
+                                   f"Move {num_selected} course{'s' if num_selected > 1 else ''} "
+                                   f"to {semesters[target_index].get('semester', '')}?"):
+                self._move_courses(src_semester_index, selected_indices, target_index)
+            return
+        
         # Create dialog to select target semester
         dialog = tk.Toplevel(self)
         dialog.title("Move Courses to Semester")
-        dialog.geometry("650x450")  # Increased size to ensure buttons are visible
         dialog.minsize(600, 400)    # Increased minimum size
         dialog.transient(self)
         dialog.grab_set()
@@ -306,17 +413,17 @@ class CoursePanel(ttk.LabelFrame):
         
         # Get courses for display
         courses = self.manager.get_courses_for_semester(src_semester_index)
-        selected_courses = [courses[idx] for idx in selected_indices if idx < len(courses)]
+        course_lines = [f"{courses[idx].get('code', '')} - {courses[idx].get('name', '')}\n"
+                        for idx in selected_indices if idx < len(courses)]
         
-        num_courses = len(selected_courses)
+        num_courses = len(course_lines)
         ttk.Label(info_frame, text=f"Selected {num_courses} course{'s' if num_courses > 1 else ''}:").pack(anchor=tk.W)
         
         # Show list of selected courses
         courses_text = tk.Text(info_frame, height=5, width=60, wrap=tk.WORD)
         courses_text.pack(fill=tk.X, pady=5)
         
-        for course in selected_courses:
-            courses_text.insert(tk.END, f"{course.get('code', '')} - {course.get('name', '')}\n")
+        courses_text.insert(tk.END, "".join(course_lines))
         
         courses_text.config(state=tk.DISABLED)  # Make read-only
         
@@ -338,15 +445,10 @@ class CoursePanel(ttk.LabelFrame):
         semester_listbox.configure(yscrollcommand=scrollbar.set)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Populate with semesters other than the current one
-        target_semester_indices = []  # To map listbox indices to actual semester indices
-        semesters = self.semester_manager.get_semesters()
-        for i, semester in enumerate(semesters):
-            if i != src_semester_index:  # Skip current semester
-                semester_listbox.insert(tk.END, semester.get("semester", ""))
-                target_semester_indices.append(i)
-        
-        if semester_listbox.size() == 0:
+        # Populate with semesters other than the current one, in one insert
+        if target_semester_indices:
+            semester_listbox.insert(tk.END, *(semesters[i].get("semester", "") for i in target_semester_indices))
+        else:
             ttk.Label(select_frame, text="No other semesters available.").pack(pady=10)
         
         # Button frame
@@ -363,18 +465,11 @@ class CoursePanel(ttk.LabelFrame):
             # Get the actual target semester index
             target_index = target_semester_indices[selection[0]]
             
-            # Move the courses
-            num_moved = self.manager.move_course(src_semester_index, selected_indices, target_index)
-            
-            # Update UI
-            self.update_course_list()
-            
             # Close dialog
             dialog.destroy()
             
-            # Show confirmation message
-            messagebox.showinfo("Success", 
-                              f"{num_moved} course{'s' if num_moved > 1 else ''} moved to {semesters[target_index].get('semester', '')}")
+            # Move the courses
+            self._move_courses(src_semester_index, selected_indices, target_index)
         
         # Make the buttons larger and more visible
         ttk.Button(button_frame, text="Cancel", command=dialog.destroy,
@@ -382,14 +477,32 @@ class CoursePanel(ttk.LabelFrame):
         ttk.Button(button_frame, text="Move Courses", command=move_courses,
                  width=20, padding=(5, 5)).pack(side=tk.RIGHT, padx=10, pady=10)
         
-        # Center the dialog on the screen
-        dialog.update_idletasks()
-        width = dialog.winfo_width()
-        height = dialog.winfo_height()
+        # Size and center the dialog on the screen with a single geometry call
+        width, height = 650, 450  # Increased size to ensure buttons are visible
         x = (dialog.winfo_screenwidth() // 2) - (width // 2)
         y = (dialog.winfo_screenheight() // 2) - (height // 2)
         dialog.geometry(f"{width}x{height}+{x}+{y}")
     
+    def _move_courses(self, src_semester_index, course_indices, dst_semester_index):
+        """
+        Move courses to another semester and confirm to the user.
+        
+        Args:
+            src_semester_index: Source semester index
+            course_indices: List of course indices to move
+            dst_semester_index: Destination semester index
+        """
+        # Move the courses
+        num_moved = self.manager.move_course(src_semester_index, course_indices, dst_semester_index)
+        
+        # Update UI
+        self.update_course_list()
+        
+        # Show confirmation message
+        semesters = self.semester_manager.get_semesters()
+        messagebox.showinfo("Success", 
+                          f"{num_moved} course{'s' if num_moved > 1 else ''} moved to {semesters[dst_semester_index].get('semester', '')}")
+    
     def open_course_dialog(self, course_index=None):
         """
         Open dialog to add or edit a course.
@@ -446,7 +559,7 @@ class CoursePanel(ttk.LabelFrame):
         grade_frame.pack(fill=tk.X, pady=5)
         ttk.Label(grade_frame, text="Grade:").pack(side=tk.LEFT, padx=(0, 5))
         grade_combo = ttk.Combobox(grade_frame, textvariable=grade_var, 
-                                 values=["A", "B+", "B", "C+", "C", "D+", "D", "F", "W", "P", "N"])
+                                 values=_GRADES)
         grade_combo.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
         # Credits
@@ -462,54 +575,67 @@ class CoursePanel(ttk.LabelFrame):
         course_info_text = tk.Text(info_frame, wrap=tk.WORD, height=8)
         course_info_text.pack(fill=tk.BOTH, expand=True)
         
+        # Pending lookup job and the code last shown in the info display
+        pending_lookup = None
+        shown_code = None
+        
         # Function to update course info display
         def update_course_info():
+            nonlocal pending_lookup, shown_code
+            pending_lookup = None
+            
+            # The dialog may have closed while the lookup was pending
+            if not dialog.winfo_exists():
+                return
+            
             code = course_code_var.get()
+            if code == shown_code:
+                return
+            shown_code = code
+            
             course_info_text.delete(1.0, tk.END)
             
             course = self.manager.get_course_info(code)
             if course:
                 course_name_var.set(course.get("name", ""))
                 
-                # Extract credits from format like "3(3-0-6)"
-                credit_match = re.match(r'(\d+)\(', course.get("credits", ""))
-                if credit_match:
-                    credits_var.set(credit_match.group(1))
+                course_credits = self.manager.get_course_credits(code)
+                if course_credits:
+                    credits_var.set(course_credits)
+                
+                get_display = self.manager.get_course_display
                 
                 # Display course info
-                course_info_text.insert(tk.END, f"Name: {course.get('name', '')}\n")
-                course_info_text.insert(tk.END, f"Credits: {course.get('credits', '')}\n")
+                lines = [
+                    f"Name: {course.get('name', '')}",
+                    f"Credits: {course.get('credits', '')}"
+                ]
                 
                 # Show prerequisites
                 prereqs = course.get("prerequisites", [])
                 if prereqs:
-                    prereq_names = []
-                    for prereq_code in prereqs:
-                        prereq_course = self.manager.get_course_info(prereq_code)
-                        if prereq_course:
-                            prereq_names.append(f"{prereq_code} ({prereq_course.get('name', '')})")
-                        else:
-                            prereq_names.append(prereq_code)
-                    
-                    course_info_text.insert(tk.END, f"Prerequisites: {', '.join(prereq_names)}\n")
+                    prereq_names = [get_display(prereq_code) for prereq_code in prereqs]
+                    lines.append(f"Prerequisites: {', '.join(prereq_names)}")
                 else:
-                    course_info_text.insert(tk.END, "Prerequisites: None\n")
+                    lines.append("Prerequisites: None")
                 
                 # Show corequisites
                 coreqs = course.get("corequisites", [])
                 if coreqs:
-                    coreq_names = []
-                    for coreq_code in coreqs:
-                        coreq_course = self.manager.get_course_info(coreq_code)
-                        if coreq_course:
-                            coreq_names.append(f"{coreq_code} ({coreq_course.get('name', '')})")
-                        else:
-                            coreq_names.append(coreq_code)
-                    
-                    course_info_text.insert(tk.END, f"Corequisites: {', '.join(coreq_names)}\n")
+                    coreq_names = [get_display(coreq_code) for coreq_code in coreqs]
+                    lines.append(f"Corequisites: {', '.join(coreq_names)}")
+                
+                course_info_text.insert(tk.END, "\n".join(lines) + "\n")
+        
+        # Look the code up once typing pauses rather than on every keystroke
+        def schedule_course_info(*args):
+            nonlocal pending_lookup
+            if pending_lookup is not None:
+                self.after_cancel(pending_lookup)
+            pending_lookup = self.after(_COURSE_LOOKUP_DELAY_MS, update_course_info)
         
         # Bind code entry to update course info
-        course_code_var.trace("w", lambda *args: update_course_info())
+        course_code_var.trace("w", schedule_course_info)
         
         # Update initial display if editing
         if course_index is not None:
@@ -524,7 +650,7 @@ class CoursePanel(ttk.LabelFrame):
             code = course_code_var.get()
             name = course_name_var.get()
             grade = grade_var.get()
-            credits_str = credits_var.get()
+            credits_str = credits_var.get().strip()
             
             # Validate input
             if not code:
@@ -535,12 +661,14 @@ class CoursePanel(ttk.LabelFrame):
                 messagebox.showerror("Error", "Course name is required")
                 return
             
-            try:
-                credits = int(credits_str) if credits_str else 0
-            except ValueError:
+            # Check the digits up front instead of catching int()'s ValueError
+            digits = credits_str[1:] if credits_str[:1] in ("-", "+") else credits_str
+            if credits_str and not digits.isdecimal():
                 messagebox.showerror("Error", "Credits must be a number")
                 return
             
+            credits = int(credits_str) if credits_str else 0
+            
             # Create course object
             course = {
                 "code": code,
@@ -584,9 +712,8 @@ class CoursePanel(ttk.LabelFrame):
         if course:
             name_var.set(course.get("name", ""))
             
-            # Extract credits from format like "3(3-0-6)"
-            credit_match = re.match(r'(\d+)\(', course.get("credits", ""))
-            if credit_match:
-                credits_var.set(credit_match.group(1))
+            course_credits = self.manager.get_course_credits(code)
+            if course_credits:
+                credits_var.set(course_credits)
         else:
             messagebox.showinfo("Course Lookup", f"Course code {code} not found in course data.")
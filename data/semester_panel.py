@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Semester navigation panel.
+"""
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+class SemesterPanel(ttk.LabelFrame):
+    """Panel for navigating and managing semesters."""
+    
+    def __init__(self, parent, manager, callback=None):
+        """
+        Initialize the semester panel.
+        
+        Args:
+            parent: Parent tkinter widget
+            manager: SemesterManager instance
+            callback: Function to call when semester selection changes
+        """
+        super().__init__(parent, text="Semesters", padding=10)
+        self.manager = manager
+        self.callback = callback
+        
+        # Semester names currently shown in the listbox
+        self._last_names = []
+        
+        # Edit dialog, created on first use and reused afterwards
+        self._edit_dialog = None
+        self._edit_vars = None
+        
+        # Create UI elements
+        self.create_widgets()
+        
+        # Load initial data
+        self.update_listbox()
+    
+    def create_widgets(self):
+        """Create UI widgets for semester management."""
+        # Semester list with scrollbar
+        list_frame = ttk.Frame(self)
+        list_frame.pack(fill=tk.BOTH, expand=True, pady=5)
+        
+        self.semester_listbox = tk.Listbox(list_frame, height=10, selectmode=tk.SINGLE)
+        self.semester_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.semester_listbox.bind('<<ListboxSelect>>', self.on_semester_select)
+        
+        scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=self.semester_listbox.yview)
+        self.semester_listbox.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        # Semester management buttons
+        nav_frame = ttk.Frame(self)
+        nav_frame.pack(fill=tk.X, pady=5)
+        
+        ttk.Button(nav_frame, text="Add Semester", command=self.add_semester).pack(side=tk.LEFT, padx=2)
+        ttk.Button(nav_frame, text="Edit Semester", command=self.edit_semester).pack(side=tk.LEFT, padx=2)
+        ttk.Button(nav_frame, text="Delete", command=self.delete_semester).pack(side=tk.LEFT, padx=2)
+        
+        # Semester reordering buttons
+        reorder_frame = ttk.Frame(self)
+        reorder_frame.pack(fill=tk.X, pady=5)
+        
+        ttk.Button(reorder_frame, text="Move Up ↑", command=self.move_semester_up).pack(side=tk.LEFT, padx=2)
+        ttk.Button(reorder_frame, text="Move Down ↓", command=self.move_semester_down).pack(side=tk.LEFT, padx=2)
+        ttk.Button(reorder_frame, text="Sort by Date", command=self.sort_semesters).pack(side=tk.LEFT, padx=2)
+    
+    def update_listbox(self):
+        """
+        Update the semester listbox from the manager.
+        
+        Only rows whose names changed are replaced, so a rename or a
+        single move touches a couple of rows instead of the whole list.
+        """
+        listbox = self.semester_listbox
+        delete = listbox.delete
+        insert = listbox.insert
+        
+        last_names = self._last_names
+        new_names = [semester.get("semester", "Unnamed Semester") for semester in self.manager.get_semesters()]
+        
+        # Replace rows whose name changed
+        for i, (old_name, new_name) in enumerate(zip(last_names, new_names)):
+            if old_name != new_name:
+                delete(i)
+                insert(i, new_name)
+        
+        # Remove surplus rows or add missing ones
+        if len(last_names) > len(new_names):
+            delete(len(new_names), tk.END)
+        elif len(new_names) > len(last_names):
+            insert(tk.END, *new_names[len(last_names):])
+        
+        self._last_names = new_names
+        
+        # Select the current semester
+        listbox.selection_clear(0, tk.END)
+        current_index = self.manager.get_current_semester_index()
+        if current_index < len(new_names):
+            listbox.selection_set(current_index)
+    
+    def on_semester_select(self, event):
+        """Handle semester selection."""
+        selection = self.semester_listbox.curselection()
+        if selection:
+            index = selection[0]
+            self.manager.set_current_semester_index(index)
+            
+            # Call the callback
+            if self.callback:
+                self.callback()
+    
+    def add_semester(self):
+        """Add a new semester."""
+        self.manager.add_semester()
+        self.update_listbox()
+        
+        # Select the new semester
+        self.semester_listbox.selection_set(self.manager.get_current_semester_index())
+        
+        # Call the callback
+        if self.callback:
+            self.callback()
+    
+    def edit_semester(self):
+        """Edit the current semester."""
+        current_semester = self.manager.get_current_semester()
+        if not current_semester:
+            messagebox.showinfo("Info", "No semester selected")
+            return
+        
+        # Build the dialog once and reuse it for later edits
+        if self._edit_dialog is None or not self._edit_dialog.winfo_exists():
+            self._create_edit_dialog()
+        
+        semester_type_var, year_var, sem_gpa_var, cum_gpa_var = self._edit_vars
+        semester_type_var.set(current_semester.get("semester_type", ""))
+        year_var.set(current_semester.get("year", ""))
+        sem_gpa_var.set(str(current_semester.get("sem_gpa", "")))
+        cum_gpa_var.set(str(current_semester.get("cum_gpa", "")))
+        
+        dialog = self._edit_dialog
+        dialog.deiconify()
+        dialog.lift()
+        dialog.grab_set()
+    
+    def _create_edit_dialog(self):
+        """Create the hidden semester edit dialog."""
+        dialog = tk.Toplevel(self)
+        dialog.withdraw()
+        dialog.title("Edit Semester")
+        dialog.transient(self)
+        
+        # Create variables
+        semester_type_var = tk.StringVar(dialog)
+        year_var = tk.StringVar(dialog)
+        sem_gpa_var = tk.StringVar(dialog)
+        cum_gpa_var = tk.StringVar(dialog)
+        
+        # Create form
+        form_frame = ttk.Frame(dialog, padding=20)
+        form_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Semester Type
+        type_frame = ttk.Frame(form_frame)
+        type_frame.pack(fill=tk.X, pady=5)
+        ttk.Label(type_frame, text="Semester Type:").pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Combobox(type_frame, textvariable=semester_type_var, 
+                   values=["First", "Second", "Summer"]).pack(side=tk.LEFT, fill=tk.X, expand=True)
+        
+        # Year
+        year_frame = ttk.Frame(form_frame)
+        year_frame.pack(fill=tk.X, pady=5)
+        ttk.Label(year_frame, text="Year:").pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Entry(year_frame, textvariable=year_var).pack(side=tk.LEFT, fill=tk.X, expand=True)
+        
+        # GPA info
+        gpa_frame = ttk.Frame(form_frame)
+        gpa_frame.pack(fill=tk.X, pady=5)
+        
+        ttk.Label(gpa_frame, text="Semester GPA:").pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Entry(gpa_frame, textvariable=sem_gpa_var, width=8).pack(side=tk.LEFT, padx=(0, 10))
+        
+        ttk.Label(gpa_frame, text="Cumulative GPA:").pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Entry(gpa_frame, textvariable=cum_gpa_var, width=8).pack(side=tk.LEFT)
+        
+        # Buttons
+        button_frame = ttk.Frame(form_frame)
+        button_frame.pack(fill=tk.X, pady=10)
+        
+        def hide_dialog():
+            dialog.grab_release()
+            dialog.withdraw()
+        
+        def save_changes():
+            data = {
+                "semester_type": semester_type_var.get(),
+                "year": year_var.get(),
+                "sem_gpa": None,
+                "cum_gpa": None
+            }
+            
+            # Parse GPAs
+            try:
+                if sem_gpa_var.get():
+                    data["sem_gpa"] = float(sem_gpa_var.get())
+            except ValueError:
+                pass
+            
+            try:
+                if cum_gpa_var.get():
+                    data["cum_gpa"] = float(cum_gpa_var.get())
+            except ValueError:
+                pass
+            
+            # Update semester
+            self.manager.update_semester(self.manager.get_current_semester_index(), data)
+            
+            # Update UI
+            self.update_listbox()
+            
+            # Call the callback
+            if self.callback:
+                self.callback()
+            
+            hide_dialog()
+        
+        ttk.Button(button_frame, text="Cancel", command=hide_dialog).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(button_frame, text="Save", command=save_changes).pack(side=tk.RIGHT, padx=5)
+        
+        # Closing the window only hides it
+        dialog.protocol("WM_DELETE_WINDOW", hide_dialog)
+        
+        self._edit_dialog = dialog
+        self._edit_vars = (semester_type_var, year_var, sem_gpa_var, cum_gpa_var)
+    
+    def delete_semester(self):
+        """Delete the current semester."""
+        current_semester = self.manager.get_current_semester()
+        if not current_semester:
+            messagebox.showinfo("Info", "No semester selected")
+            return
+        
+        if messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this semester?"):
+            self.manager.delete_semester()
+            self.update_listbox()
+            
+            # Select the new current semester
+            current_index = self.manager.get_current_semester_index()
+            if current_index < self.semester_listbox.size():
+                self.semester_listbox.selection_set(current_index)
+            
+            # Call the callback
+            if self.callback:
+                self.callback()
+    
+    def move_semester_up(self):
+        """Move the current semester up in the list."""
+        if self.manager.move_semester_up():
+            self.update_listbox()
+            
+            # Select the moved semester
+            current_index = self.manager.get_current_semester_index()
+            self.semester_listbox.selection_set(current_index)
+            
+            # Call the callback
+            if self.callback:
+                self.callback()
+    
+    def move_semester_down(self):
+        """Move the current semester down in the list."""
+        if self.manager.move_semester_down():
+            self.update_listbox()
+            
+            # Select the moved semester
+            current_index = self.manager.get_current_semester_index()
+            self.semester_listbox.selection_set(current_index)
+            
+            # Call the callback
+            if self.callback:
+                self.callback()
+    
+    def sort_semesters(self):
+        """Sort all semesters chronologically in one step."""
+        if self.manager.sort_semesters():
+            self.update_listbox()
+            
+            # Call the callback
+            if self.callback:
+                self.callback()
@@ -7,6 +7,15 @@ from datetime import datetime
 
 logger = logging.getLogger("transcript_model")
 
+# Grades whose credits don't count toward a semester's total
+_UNCOUNTED_GRADES = frozenset(('W', 'N'))
+
+# Chronological position of each semester type within an academic year
+_SEMESTER_ORDER = {"Summer": 0, "First": 1, "Second": 2}
+
+# Semester type that follows each type, and how many years to advance
+_NEXT_SEMESTER = {"First": ("Second", 0), "Second": ("Summer", 0), "Summer": ("First", 1)}
+
 class TranscriptModel:
     """Data model for transcript information."""
     
@@ -41,6 +50,10 @@ class TranscriptModel:
     
     def set_changed(self, changed=True):
         """Mark data as changed."""
+        # Nothing to do if the flag already has this value; keeps repeated
+        # edits from re-announcing a change once observers are attached
+        if self.changed is changed:
+            return
         self.changed = changed
     
     def get_current_semester(self):
@@ -56,30 +69,26 @@ class TranscriptModel:
         Returns:
             The newly created semester
         """
+        current_year = datetime.now().year
+        
         # Default to next logical semester
         next_type = "First"
-        next_year = datetime.now().year
+        next_year = current_year
         
         if self.semesters:
             # Try to determine next logical semester
             last_semester = self.semesters[-1]
             last_type = last_semester.get("semester_type", "")
-            last_year = last_semester.get("year", str(datetime.now().year))
+            last_year = last_semester.get("year", str(current_year))
             
             try:
                 last_year_int = int(last_year)
             except ValueError:
-                last_year_int = datetime.now().year
+                last_year_int = current_year
             
-            if last_type == "First":
-                next_type = "Second"
-                next_year = last_year_int
-            elif last_type == "Second":
-                next_type = "Summer"
-                next_year = last_year_int
-            elif last_type == "Summer":
-                next_type = "First"
-                next_year = last_year_int + 1
+            if last_type in _NEXT_SEMESTER:
+                next_type, year_delta = _NEXT_SEMESTER[last_type]
+                next_year = last_year_int + year_delta
         
         # Create new semester
         new_semester = {
@@ -87,7 +96,7 @@ class TranscriptModel:
             "semester_type": next_type,
             "year": str(next_year),
             "year_int": next_year,
-            "semester_order": 1 if next_type == "First" else (2 if next_type == "Second" else 0),
+            "semester_order": _SEMESTER_ORDER[next_type],
             "courses": [],
             "sem_gpa": None,
             "cum_gpa": None,
@@ -189,6 +198,35 @@ class TranscriptModel:
         logger.info(f"Moved semester down: {self.semesters[index+1].get('semester', '')}")
         return True
     
+    def sort_semesters(self):
+        """
+        Sort semesters chronologically by year and semester order.
+        
+        The current semester stays selected wherever it ends up.
+        
+        Returns:
+            True if the order changed, False otherwise
+        """
+        if len(self.semesters) < 2:
+            return False
+        
+        current = self.get_current_semester()
+        old_order = list(self.semesters)
+        
+        self.semesters.sort(key=lambda semester: (semester.get("year_int", 0), semester.get("semester_order", 3)))
+        
+        if all(a is b for a, b in zip(old_order, self.semesters)):
+            return False
+        
+        # Follow the current semester to its new position
+        if current is not None:
+            self.current_semester_index = next(
+                i for i, semester in enumerate(self.semesters) if semester is current)
+        
+        self.set_changed()
+        logger.info("Sorted semesters chronologically")
+        return True
+    
     def update_semester(self, index, data):
         """
         Update semester data.
@@ -223,17 +261,10 @@ class TranscriptModel:
             semester["year_int"] = 0
         
         # Update semester_order
-        if semester_type == "Summer":
-            semester["semester_order"] = 0
-        elif semester_type == "First":
-            semester["semester_order"] = 1
-        elif semester_type == "Second":
-            semester["semester_order"] = 2
-        else:
-            semester["semester_order"] = 3
+        semester["semester_order"] = _SEMESTER_ORDER.get(semester_type, 3)
         
         self.set_changed()
-        logger.info(f"Updated semester: {semester['semester']}")
+        logger.info("Updated semester: %s", semester['semester'])
         return True
     
     def add_course(self, semester_index, course_data):
@@ -257,7 +288,7 @@ class TranscriptModel:
         self.recalculate_semester_credits(semester_index)
         
         self.set_changed()
-        logger.info(f"Added course {course_data.get('code', '')} to semester {self.semesters[semester_index].get('semester', '')}")
+        logger.info("Added course %s to semester %s", course_data.get('code', ''), self.semesters[semester_index].get('semester', ''))
         return True
     
     def update_course(self, semester_index, course_index, course_data):
@@ -286,7 +317,7 @@ class TranscriptModel:
         self.recalculate_semester_credits(semester_index)
         
         self.set_changed()
-        logger.info(f"Updated course {course_data.get('code', '')} in semester {self.semesters[semester_index].get('semester', '')}")
+        logger.info("Updated course %s in semester %s", course_data.get('code', ''), self.semesters[semester_index].get('semester', ''))
         return True
     
     def delete_course(self, semester_index, course_index):
@@ -314,7 +345,7 @@ class TranscriptModel:
         self.recalculate_semester_credits(semester_index)
         
         self.set_changed()
-        logger.info(f"Deleted course {deleted.get('code', '')} from semester {self.semesters[semester_index].get('semester', '')}")
+        logger.info("Deleted course %s from semester %s", deleted.get('code', ''), self.semesters[semester_index].get('semester', ''))
         return True
     
     def recalculate_semester_credits(self, semester_index):
@@ -328,15 +359,31 @@ class TranscriptModel:
             return
         
         semester = self.semesters[semester_index]
-        total_credits = 0
-        
-        for course in semester.get("courses", []):
-            # Only count credits for non-withdrawn courses
-            if course.get("grade") not in ['W', 'N']:
-                total_credits += course.get("credits", 0)
+        total_credits = self.count_credits(semester.get("courses", ()))
         
         semester["total_credits"] = total_credits
-        logger.debug(f"Recalculated credits for semester {semester.get('semester', '')}: {total_credits}")
+        logger.debug("Recalculated credits for semester %s: %s", semester.get('semester', ''), total_credits)
+    
+    def recalculate_all_credits(self):
+        """Recalculate total credits for every semester in one pass."""
+        count_credits = self.count_credits
+        for semester in self.semesters:
+            semester["total_credits"] = count_credits(semester.get("courses", ()))
+        logger.debug("Recalculated credits for %d semesters", len(self.semesters))
+    
+    @staticmethod
+    def count_credits(courses):
+        """
+        Count the credits of courses that count toward a semester's total.
+        
+        Args:
+            courses: List of course dictionaries
+            
+        Returns:
+            Total credits, excluding withdrawn and non-credit courses
+        """
+        return sum(course.get("credits", 0) for course in courses
+                   if course.get("grade") not in _UNCOUNTED_GRADES)
     
     def to_dict(self):
         """
@@ -357,9 +404,11 @@ class TranscriptModel:
         Args:
             data: Dictionary with transcript data
         """
-        if "student_info" in data and isinstance(data["student_info"], dict):
-            self.student_info = data["student_info"]
+        student_info = data.get("student_info")
+        if isinstance(student_info, dict):
+            self.student_info = student_info
         
-        if "semesters" in data and isinstance(data["semesters"], list):
-            self.semesters = data["semesters"]
-            self.current_semester_index = 0 if self.semesters else 0
+        semesters = data.get("semesters")
+        if isinstance(semesters, list):
+            self.semesters = semesters
+            self.current_semester_index = 0
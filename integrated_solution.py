@@ -5,30 +5,26 @@ This script provides a simple launcher for the transcript editor and validator.
 """
 import os
 import sys
+import functools
 import subprocess
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import json
 import logging
 from pathlib import Path
-import importlib.resources
-import importlib.util
-import pkg_resources
 
 # Set up logging
 from utils.logger_setup import setup_logging
 setup_logging()
 logger = logging.getLogger("integrated_solution")
 
-# Find the package root directory
-try:
-    # First try to get the installed package location
-    package_root = Path(pkg_resources.resource_filename(__name__, ''))
-    logger.info(f"Using installed package at: {package_root}")
-except (ImportError, pkg_resources.DistributionNotFound):
-    # Fall back to the current directory if not installed as package
-    package_root = Path(__file__).parent
-    logger.info(f"Using local directory: {package_root}")
+# How often the UI checks on a running background validation (ms)
+VALIDATION_POLL_MS = 100
+
+# Package root is this module's directory
+package_root = Path(os.path.dirname(os.path.abspath(__file__)))
+logger.info(f"Using package directory: {package_root}")
 
 # Add package root to path for imports
 sys.path.append(str(package_root))
@@ -38,6 +34,36 @@ from utils.config import config
 from utils.validation_adapter import ValidationAdapter
 from ui.dialogs import CourseDataSelectorDialog
 
+def load_transcript_json(json_path):
+    """
+    Load a JSON transcript file.
+    
+    Parsed data is cached by path and modification time, so validating the
+    same unchanged transcript again does not re-read it.
+    
+    Args:
+        json_path: Path to JSON transcript file
+        
+    Returns:
+        Dictionary with transcript data; treat it as read-only
+    """
+    return _load_transcript_json_cached(str(json_path), os.path.getmtime(json_path))
+
+@functools.lru_cache(maxsize=4)
+def _load_transcript_json_cached(json_path, mtime):
+    """
+    Parse a JSON transcript file.
+    
+    Args:
+        json_path: Path to JSON transcript file
+        mtime: Modification time of the file, used as part of the cache key
+        
+    Returns:
+        Dictionary with transcript data
+    """
+    with open(json_path, 'r', encoding='utf-8') as file:
+        return json.load(file)
+
 class LauncherApp(tk.Tk):
     """Launcher application for the Course Registration Validation System."""
     
@@ -46,6 +72,9 @@ class LauncherApp(tk.Tk):
         self.title("Course Registration Validation System")
         self.geometry("600x400")
         
+        # Background validation thread, if one is running
+        self._validation_thread = None
+        
         self.setup_paths()
         self.create_widgets()
     
@@ -186,6 +215,9 @@ class LauncherApp(tk.Tk):
         """
         Perform validation with selected files.
         
+        The work runs on a background thread so the window stays responsive;
+        the result is shown once it finishes.
+        
         Args:
             json_path: Path to JSON transcript file
             course_data_path: Path to course data file
@@ -194,15 +226,37 @@ class LauncherApp(tk.Tk):
             self.status_var.set("Validation cancelled - no course data selected")
             return
         
+        if self._validation_thread is not None and self._validation_thread.is_alive():
+            self.status_var.set("A validation is already running - please wait")
+            return
+        
+        self.status_var.set(f"Validating using {os.path.basename(course_data_path)}...")
+        
+        result = {}
+        self._validation_thread = threading.Thread(target=self._run_validation,
+                                                   args=(json_path, course_data_path, result),
+                                                   daemon=True)
+        self._validation_thread.start()
+        self.after(VALIDATION_POLL_MS, self._poll_validation, course_data_path, result)
+    
+    def _run_validation(self, json_path, course_data_path, result):
+        """
+        Validate a transcript and save its report on a background thread.
+        
+        Only fills in result; all Tk calls happen in _poll_validation.
+        
+        Args:
+            json_path: Path to JSON transcript file
+            course_data_path: Path to course data file
+            result: Dictionary to store the outcome in
+        """
         try:
-            self.status_var.set(f"Validating using {os.path.basename(course_data_path)}...")
-            
-            # Initialize validator with selected course data
+            # Initialize validator with selected course data; the adapter
+            # reuses its validator while the course data file is unchanged
             self.validation_adapter.initialize_validator(course_data_path)
             
             # Process transcript
-            with open(json_path, 'r', encoding='utf-8') as file:
-                data = json.load(file)
+            data = load_transcript_json(json_path)
             
             student_info = data.get("student_info", {})
             semesters = data.get("semesters", [])
@@ -221,16 +275,52 @@ class LauncherApp(tk.Tk):
             with open(output_path, 'w', encoding='utf-8') as file:
                 file.write(report)
             
-            # Show success message
-            invalid_count = len([r for r in validation_results if not r.get("is_valid", True)])
-            message = (f"Validation completed for {student_info.get('name')} (ID: {student_id})\n\n"
-                     f"Semesters: {len(semesters)}\n"
-                     f"Valid registrations: {len(validation_results) - invalid_count}\n"
-                     f"Invalid registrations: {invalid_count}\n\n"
-                     f"Course data: {os.path.basename(course_data_path)}\n"
-                     f"Report saved to: {output_path}\n\n"
-                     f"Would you like to view the report?")
-            
+            result.update(
+                student_info=student_info,
+                student_id=student_id,
+                semester_count=len(semesters),
+                result_count=len(validation_results),
+                invalid_count=len([r for r in validation_results if not r.get("is_valid", True)]),
+                output_path=output_path
+            )
+        
+        except Exception as e:
+            logger.error(f"Error validating transcript: {e}")
+            import traceback
+            logger.error(traceback.format_exc())
+            result["error"] = e
+    
+    def _poll_validation(self, course_data_path, result):
+        """
+        Show the validation result once the background thread finishes.
+        
+        Args:
+            course_data_path: Path to course data file
+            result: Dictionary filled in by _run_validation
+        """
+        if self._validation_thread.is_alive():
+            self.after(VALIDATION_POLL_MS, self._poll_validation, course_data_path, result)
+            return
+        
+        if "error" in result or not result:
+            error = result.get("error", "validation did not complete")
+            messagebox.showerror("Error", f"Failed to validate transcript: {error}")
+            self.status_var.set("Error during validation")
+            return
+        
+        output_path = result["output_path"]
+        invalid_count = result["invalid_count"]
+        
+        # Show success message
+        message = (f"Validation completed for {result['student_info'].get('name')} (ID: {result['student_id']})\n\n"
+                 f"Semesters: {result['semester_count']}\n"
+                 f"Valid registrations: {result['result_count'] - invalid_count}\n"
+                 f"Invalid registrations: {invalid_count}\n\n"
+                 f"Course data: {os.path.basename(course_data_path)}\n"
+                 f"Report saved to: {output_path}\n\n"
+                 f"Would you like to view the report?")
+        
+        try:
             if messagebox.askyesno("Validation Complete", message):
                 # Open the report file with the default text editor
                 if sys.platform == 'win32':
@@ -239,15 +329,11 @@ class LauncherApp(tk.Tk):
                     subprocess.call(['open', output_path])
                 else:  # Linux
                     subprocess.call(['xdg-open', output_path])
-            
-            self.status_var.set(f"Validation complete - {invalid_count} issues found")
-        
         except Exception as e:
-            logger.error(f"Error validating transcript: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
-            messagebox.showerror("Error", f"Failed to validate transcript: {e}")
-            self.status_var.set("Error during validation")
+            logger.error(f"Error opening validation report: {e}")
+            messagebox.showerror("Error", f"Failed to open validation report: {e}")
+        
+        self.status_var.set(f"Validation complete - {invalid_count} issues found")
     
     def on_course_data_selected(self, file_path):
         """
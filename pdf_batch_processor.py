@@ -11,6 +11,7 @@ import csv
 import logging
 from pathlib import Path
 from typing import Dict, List, Tuple, Set
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 try:
     import PyPDF2
@@ -19,9 +20,61 @@ except ImportError:
     os.system("pip install PyPDF2")
     import PyPDF2
 
+# pypdfium2 (PDFium bindings) extracts text much faster than PyPDF2 but is optional
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
 # Set up basic logging
 logging.basicConfig(level=logging.WARNING)
 
+# Patterns are compiled once at import instead of on every PDF
+_ID_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'Student\s+No\s*[:\.]?\s*(\d+)',
+    r'รหัสนักศึกษา\s*[:\.]?\s*(\d+)',
+    r'Student\s+ID\s*[:\.]?\s*(\d+)',
+    r'ID\s*[:\.]?\s*(\d+)'
+)]
+
+_NAME_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'Name\s*[:\.]?\s*([^\n\r]+?)(?=Field|Date|Student|$)',
+    r'ชื่อ\s*[:\.]?\s*([^\n\r]+?)(?=สาขา|วันที่|$)',
+    r'Name\s*[:\.]?\s*(.+?)(?=\n|\r|$)'
+)]
+
+_WS_RE = re.compile(r'\s+')
+_NAME_TAIL_RE = re.compile(r'(Field of Study|Date of Admission).*')
+
+_SEMESTER_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(First|Second|Summer)\s+(Semester|Session)\s+(\d{4})',
+    r'ภาคเรียนที่\s*\d+.*?\d{4}',
+    r'Semester\s*\d+.*?\d{4}'
+)]
+
+# Course line patterns, each paired with the group holding the grade
+_COURSE_PATTERNS = [(re.compile(pattern, re.MULTILINE | re.IGNORECASE), grade_group) for pattern, grade_group in (
+    # Pattern 1: Course code, course name, grade, credits (most common format)
+    (r'(01\d{6})\s+([^0-9\n\r]{10,80}?)\s+([ABCDF][\+\-]?|[WPNI])\s+(\d{1,2})\s*(?:\n|\r|$)', 3),
+    # Pattern 2: Course code followed by grade (more flexible)
+    (r'(01\d{6})\s+.{5,100}?\s+([ABCDF][\+\-]?|[WPNI])(?:\s+\d{1,2})?\s*(?:\n|\r|$)', 2),
+    # Pattern 3: Just course code and grade close together
+    (r'(01\d{6})\s+.*?\s+([ABCDF][\+\-]?|[WPNI])\s*(?:\n|\r)', 2)
+)]
+
+# Valid grades including I
+_VALID_GRADES = frozenset({'A', 'B+', 'B', 'C+', 'C', 'D+', 'D', 'F', 'W', 'P', 'N', 'I'})
+
+_COURSE_CODE_RE = re.compile(r'(01\d{6})')
+_GRADE_RE = re.compile(r'\b([ABCDF][\+\-]?|[WPNI])\b')
+
+# Words that mark course descriptions rather than student grades
+_CATALOG_RE = re.compile('|'.join(map(re.escape, (
+    'prerequisite', 'corequisite', 'credit', 'laboratory',
+    'lecture', 'introduction to', 'advanced', 'basic',
+    'semester hour', 'course description'
+))), re.IGNORECASE)
+
 class PDFTranscriptExtractor:
     """Extract transcript data from PDF files."""
     
@@ -32,6 +85,9 @@ class PDFTranscriptExtractor:
     def extract_text_from_pdf(self, pdf_path: str) -> str:
         """Extract text from PDF file."""
         try:
+            if pdfium is not None:
+                return self._extract_text_pdfium(pdf_path)
+            
             all_text = []
             with open(pdf_path, 'rb') as file:
                 reader = PyPDF2.PdfReader(file)
@@ -44,40 +100,45 @@ class PDFTranscriptExtractor:
             print(f"Error extracting text from {pdf_path}: {e}")
             return ""
     
+    def _extract_text_pdfium(self, pdf_path: str) -> str:
+        """Extract text from PDF file with PDFium."""
+        all_text = []
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            for page in pdf:
+                textpage = page.get_textpage()
+                # PDFium ends lines with CRLF; match PyPDF2's line breaks
+                page_text = textpage.get_text_range().replace("\r\n", "\n")
+                textpage.close()
+                page.close()
+                if page_text and page_text.strip():
+                    all_text.append(page_text)
+        finally:
+            # Free the native document right away rather than at collection
+            pdf.close()
+        return "\n".join(all_text)
+    
     def extract_student_info(self, text: str) -> Dict[str, str]:
         """Extract student information from text."""
         student_id = "Unknown"
         student_name = "Unknown"
         
         # Extract student ID
-        id_patterns = [
-            r'Student\s+No\s*[:\.]?\s*(\d+)',
-            r'รหัสนักศึกษา\s*[:\.]?\s*(\d+)',
-            r'Student\s+ID\s*[:\.]?\s*(\d+)',
-            r'ID\s*[:\.]?\s*(\d+)'
-        ]
-        
-        for pattern in id_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _ID_PATTERNS:
+            match = pattern.search(text)
             if match:
                 student_id = match.group(1).strip()
                 break
         
         # Extract student name
-        name_patterns = [
-            r'Name\s*[:\.]?\s*([^\n\r]+?)(?=Field|Date|Student|$)',
-            r'ชื่อ\s*[:\.]?\s*([^\n\r]+?)(?=สาขา|วันที่|$)',
-            r'Name\s*[:\.]?\s*(.+?)(?=\n|\r|$)'
-        ]
-        
-        for pattern in name_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _NAME_PATTERNS:
+            match = pattern.search(text)
             if match:
                 name = match.group(1).strip()
                 # Clean up the name
-                name = re.sub(r'\s+', ' ', name)
+                name = _WS_RE.sub(' ', name)
                 # Remove common unwanted text
-                name = re.sub(r'(Field of Study|Date of Admission).*', '', name).strip()
+                name = _NAME_TAIL_RE.sub('', name).strip()
                 if name and len(name) > 2:
                     student_name = name
                     break
@@ -92,26 +153,17 @@ class PDFTranscriptExtractor:
         courses_grades = {}
         
         # Try to find student-specific transcript section
-        # Look for semester headers and course lists
-        semester_patterns = [
-            r'(First|Second|Summer)\s+(Semester|Session)\s+(\d{4})',
-            r'ภาคเรียนที่\s*\d+.*?\d{4}',
-            r'Semester\s*\d+.*?\d{4}'
-        ]
-        
-        # Find all semester sections
+        # by looking for semester headers and course lists
         semester_sections = []
-        for pattern in semester_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
+        for pattern in _SEMESTER_PATTERNS:
+            for match in pattern.finditer(text):
                 start_pos = match.start()
-                # Find the end of this semester (next semester or end of text)
-                next_semester = None
-                for next_match in re.finditer(pattern, text[start_pos + 1:], re.IGNORECASE):
-                    next_semester = start_pos + 1 + next_match.start()
-                    break
+                # Find the end of this semester (next semester or end of text),
+                # searching in place rather than on a copy of the remaining text
+                next_match = pattern.search(text, start_pos + 1)
                 
-                if next_semester:
-                    semester_text = text[start_pos:next_semester]
+                if next_match:
+                    semester_text = text[start_pos:next_match.start()]
                 else:
                     # Take a reasonable chunk after semester header
                     semester_text = text[start_pos:start_pos + 2000]
@@ -133,34 +185,15 @@ class PDFTranscriptExtractor:
         """Extract courses from a specific text section with better precision."""
         courses_grades = {}
         
-        # Valid grades including I
-        valid_grades = {'A', 'B+', 'B', 'C+', 'C', 'D+', 'D', 'F', 'W', 'P', 'N', 'I'}
-        
-        # More precise patterns for course extraction
-        # Pattern 1: Course code, course name, grade, credits (most common format)
-        pattern1 = r'(01\d{6})\s+([^0-9\n\r]{10,80}?)\s+([ABCDF][\+\-]?|[WPNI])\s+(\d{1,2})\s*(?:\n|\r|$)'
-        
-        # Pattern 2: Course code followed by grade (more flexible)
-        pattern2 = r'(01\d{6})\s+.{5,100}?\s+([ABCDF][\+\-]?|[WPNI])(?:\s+\d{1,2})?\s*(?:\n|\r|$)'
-        
-        # Pattern 3: Just course code and grade close together
-        pattern3 = r'(01\d{6})\s+.*?\s+([ABCDF][\+\-]?|[WPNI])\s*(?:\n|\r)'
-        
-        patterns = [pattern1, pattern2, pattern3]
-        
-        for pattern in patterns:
-            matches = re.finditer(pattern, text, re.MULTILINE | re.IGNORECASE)
-            for match in matches:
+        for pattern, grade_group in _COURSE_PATTERNS:
+            for match in pattern.finditer(text):
                 course_code = match.group(1)
                 
                 # Get grade (different position depending on pattern)
-                if pattern == pattern1:
-                    grade = match.group(3).upper()
-                else:
-                    grade = match.group(2).upper()
+                grade = match.group(grade_group).upper()
                 
                 # Validate grade
-                if grade in valid_grades:
+                if grade in _VALID_GRADES:
                     # Skip if this looks like a course catalog entry (too many repeated grades)
                     context = match.group(0)
                     if not self._looks_like_catalog_entry(context):
@@ -168,39 +201,41 @@ class PDFTranscriptExtractor:
                         
         # Additional pattern for lines that might have different formatting
         # Look for lines with course codes followed by single letter grades
-        lines = text.split('\n')
-        for line in lines:
-            # Skip obviously non-grade lines
-            if len(line) < 10 or 'prerequisite' in line.lower() or 'corequisite' in line.lower():
+        for line in text.split('\n'):
+            # Only lines containing "01" can hold a course code; this cheap
+            # substring test rules out most lines before any other work
+            if '01' not in line or len(line) < 10:
                 continue
-                
+            
             # Look for course code + grade pattern in the line
-            course_match = re.search(r'(01\d{6})', line)
-            if course_match:
-                course_code = course_match.group(1)
-                
-                # Look for grades in the same line
-                grade_matches = re.findall(r'\b([ABCDF][\+\-]?|[WPNI])\b', line)
-                
-                # Take the last grade found (most likely to be the actual grade)
-                if grade_matches:
-                    grade = grade_matches[-1].upper()
-                    if grade in valid_grades and course_code not in courses_grades:
-                        courses_grades[course_code] = grade
+            course_match = _COURSE_CODE_RE.search(line)
+            if not course_match:
+                continue
+            
+            course_code = course_match.group(1)
+            if course_code in courses_grades:
+                continue
+            
+            # Skip obviously non-grade lines
+            line_lower = line.lower()
+            if 'prerequisite' in line_lower or 'corequisite' in line_lower:
+                continue
+            
+            # Look for grades in the same line
+            grade_matches = _GRADE_RE.findall(line)
+            
+            # Take the last grade found (most likely to be the actual grade)
+            if grade_matches:
+                grade = grade_matches[-1].upper()
+                if grade in _VALID_GRADES:
+                    courses_grades[course_code] = grade
         
         return courses_grades
     
     def _looks_like_catalog_entry(self, text: str) -> bool:
         """Check if text looks like a course catalog entry rather than student grade."""
         # Skip entries that look like course descriptions
-        catalog_indicators = [
-            'prerequisite', 'corequisite', 'credit', 'laboratory', 
-            'lecture', 'introduction to', 'advanced', 'basic',
-            'semester hour', 'course description'
-        ]
-        
-        text_lower = text.lower()
-        return any(indicator in text_lower for indicator in catalog_indicators)
+        return _CATALOG_RE.search(text) is not None
     
     def process_pdf(self, pdf_path: str) -> Tuple[Dict[str, str], Dict[str, str]]:
         """Process a single PDF file."""
@@ -226,6 +261,10 @@ class PDFTranscriptExtractor:
         """Get all course codes sorted numerically."""
         return sorted(list(self.all_course_codes))
 
+def _process_one(pdf_path: str) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """Process a single PDF file in a worker process."""
+    return PDFTranscriptExtractor().process_pdf(pdf_path)
+
 def main():
     """Main function to process all PDFs in current directory."""
     
@@ -251,24 +290,38 @@ def main():
     
     # First pass: Process all PDFs to collect all course codes
     print("Phase 1: Collecting all course codes...")
-    all_results = []
+    results_by_index = {}
     
-    for pdf_file in pdf_files:
-        try:
-            student_info, courses_grades = extractor.process_pdf(str(pdf_file))
-            
-            if student_info.get("name") != "Unknown":
-                all_results.append({
-                    "student_info": student_info,
-                    "courses_grades": courses_grades,
-                    "filename": pdf_file.name
-                })
-                print(f"✓ {student_info.get('name')} ({student_info.get('id')}) - {len(courses_grades)} courses")
-            else:
-                print(f"✗ Failed to extract data from: {pdf_file.name}")
+    # Each PDF is independent, so spread them across worker processes
+    max_workers = min(os.cpu_count() or 1, len(pdf_files))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(_process_one, str(pdf_file)): index
+                   for index, pdf_file in enumerate(pdf_files)}
+        
+        for future in as_completed(futures):
+            index = futures[future]
+            pdf_file = pdf_files[index]
+            try:
+                student_info, courses_grades = future.result()
                 
-        except Exception as e:
-            print(f"✗ Error processing {pdf_file.name}: {e}")
+                # Add course codes to global set
+                extractor.all_course_codes.update(courses_grades)
+                
+                if student_info.get("name") != "Unknown":
+                    results_by_index[index] = {
+                        "student_info": student_info,
+                        "courses_grades": courses_grades,
+                        "filename": pdf_file.name
+                    }
+                    print(f"✓ {student_info.get('name')} ({student_info.get('id')}) - {len(courses_grades)} courses")
+                else:
+                    print(f"✗ Failed to extract data from: {pdf_file.name}")
+                    
+            except Exception as e:
+                print(f"✗ Error processing {pdf_file.name}: {e}")
+    
+    # Keep rows in file order regardless of which worker finished first
+    all_results = [results_by_index[index] for index in sorted(results_by_index)]
     
     if not all_results:
         print("\nNo valid data extracted from any PDF files.")
@@ -303,17 +356,11 @@ def main():
             # Write data rows
             for result in all_results:
                 student_info = result["student_info"]
-                courses_grades = result["courses_grades"]
-                
-                row = [
-                    student_info.get("name", "Unknown"),
-                    student_info.get("id", "Unknown")
-                ]
+                get_grade = result["courses_grades"].get
                 
-                # Add grades for each course code in sorted order
-                for course_code in sorted_course_codes:
-                    grade = courses_grades.get(course_code, "")
-                    row.append(grade)
+                # Grades for each course code in sorted order
+                row = [student_info.get("name", "Unknown"), student_info.get("id", "Unknown")]
+                row += [get_grade(course_code, "") for course_code in sorted_course_codes]
                 
                 writer.writerow(row)
         
@@ -13,6 +13,9 @@ setup(
         "PyPDF2>=2.0.0",
         "appdirs>=1.4.4",
     ],
+    extras_require={
+        "fast-pdf": ["pypdfium2>=4.0"],
+    },
     entry_points={
         'console_scripts': [
             'course-validator=integrated_solution:main',
@@ -18,9 +18,10 @@ class Config:
         self.course_data_dir = self.app_dir / "course_data"
         self.reports_dir = self.app_dir / "reports" 
         self.logs_dir = self.app_dir / "logs"
+        self.cache_dir = self.app_dir / "cache"
         
         # Create directories if they don't exist
-        for directory in [self.course_data_dir, self.reports_dir, self.logs_dir]:
+        for directory in [self.course_data_dir, self.reports_dir, self.logs_dir, self.cache_dir]:
             try:
                 directory.mkdir(exist_ok=True)
             except:
@@ -29,6 +30,29 @@ class Config:
         self.default_course_data = self.course_data_dir / "ie_core_courses.json"
         self.current_course_data = self.default_course_data if self.default_course_data.exists() else None
     
+    @property
+    def current_course_data(self):
+        """Path of the currently selected course data file, or None."""
+        return self._current_course_data
+    
+    @current_course_data.setter
+    def current_course_data(self, path):
+        self._current_course_data = path
+        self._course_data_exists = None
+    
+    @property
+    def course_data_path_valid(self):
+        """
+        Whether a current course data file is set and exists.
+        
+        The result is remembered until a different file is selected, so
+        repeated checks from the UI don't hit the filesystem.
+        """
+        if self._course_data_exists is None:
+            path = self._current_course_data
+            self._course_data_exists = bool(path) and path.exists()
+        return self._course_data_exists
+    
     def get_available_course_data_files(self):
         """Get list of available course data files."""
         files = []
@@ -49,6 +73,6 @@ class Config:
     def set_current_course_data(self, file_path):
         """Set the current course data file."""
         self.current_course_data = Path(file_path)
-        return self.current_course_data.exists()
+        return self.course_data_path_valid
 
 config = Config()
@@ -5,6 +5,7 @@ File operations for saving and loading transcript data.
 import json
 import logging
 import os
+import functools
 from pathlib import Path
 
 logger = logging.getLogger("file_operations")
@@ -70,6 +71,9 @@ def load_course_data(course_data_path):
     """
     Load course data from JSON file.
     
+    Parsed data is cached by path and modification time, so selecting the
+    same unchanged file again does not re-read it.
+    
     Args:
         course_data_path: Path to course data JSON file
         
@@ -77,24 +81,40 @@ def load_course_data(course_data_path):
         Dictionary containing course data or empty dict on failure
     """
     try:
-        if os.path.exists(course_data_path):
-            with open(course_data_path, 'r', encoding='utf-8') as file:
-                course_data = json.load(file)
-                
-            # Create a flattened dictionary of all courses for easy lookup
-            all_courses = {}
-            for course in course_data.get("industrial_engineering_courses", []):
-                all_courses[course["code"]] = course
-            
-            logger.info(f"Loaded {len(all_courses)} courses from {course_data_path}")
+        mtime = os.path.getmtime(course_data_path)
+    except OSError:
+        logger.warning(f"Course data file not found: {course_data_path}")
+        return {}
+    
+    return _load_course_data_cached(str(course_data_path), mtime)
+
+@functools.lru_cache(maxsize=4)
+def _load_course_data_cached(course_data_path, mtime):
+    """
+    Parse a course data file.
+    
+    Args:
+        course_data_path: Path to course data JSON file
+        mtime: Modification time of the file, used as part of the cache key
+        
+    Returns:
+        Dictionary containing course data or empty dict on failure
+    """
+    try:
+        with open(course_data_path, 'r', encoding='utf-8') as file:
+            course_data = json.load(file)
             
-            return {
-                "raw_data": course_data, 
-                "all_courses": all_courses
-            }
-        else:
-            logger.warning(f"Course data file not found: {course_data_path}")
-            return {}
+        # Create a flattened dictionary of all courses for easy lookup
+        all_courses = {}
+        for course in course_data.get("industrial_engineering_courses", []):
+            all_courses[course["code"]] = course
+        
+        logger.info(f"Loaded {len(all_courses)} courses from {course_data_path}")
+        
+        return {
+            "raw_data": course_data, 
+            "all_courses": all_courses
+        }
     
     except Exception as e:
         logger.error(f"Error loading course data: {e}")
@@ -115,7 +135,9 @@ def save_validation_report_excel(student_info, semesters, validation_results, fi
     """
     try:
         from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
         from openpyxl.styles import Font, PatternFill, Alignment
+        from openpyxl.utils import get_column_letter
         from datetime import datetime
         
         def calculate_gpa(courses):
@@ -158,55 +180,75 @@ def save_validation_report_excel(student_info, semesters, validation_results, fi
             
             return calculate_gpa(all_courses)
         
-        wb = Workbook()
-        
-        # Remove default sheet and create Summary sheet
-        wb.remove(wb.active)
+        # A write-only workbook streams rows to disk instead of holding every
+        # cell in memory, so rows must be appended in order and column widths
+        # must be set before the first row of each sheet is written
+        wb = Workbook(write_only=True)
         summary_ws = wb.create_sheet("Summary")
+        details_ws = wb.create_sheet("Detailed Results")
+        
+        bold_font = Font(bold=True)
+        header_fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
+        invalid_fill = PatternFill(start_color="FFCCCC", end_color="FFCCCC", fill_type="solid")
+        
+        def styled_cell(ws, value, font=None, fill=None):
+            """Create a write-only cell with optional styling."""
+            cell = WriteOnlyCell(ws, value=value)
+            if font:
+                cell.font = font
+            if fill:
+                cell.fill = fill
+            return cell
+        
+        def update_widths(widths, values):
+            """Track the longest value seen in each column."""
+            for col_num, value in enumerate(values):
+                length = len(str(value)) if value is not None else 0
+                if col_num >= len(widths):
+                    widths.append(length)
+                elif length > widths[col_num]:
+                    widths[col_num] = length
+        
+        def set_column_widths(ws, widths):
+            """Auto-adjust column widths to the longest value, capped at 50."""
+            for col_num, max_length in enumerate(widths, 1):
+                ws.column_dimensions[get_column_letter(col_num)].width = min(max_length + 2, 50)
         
         # Student Information section
-        summary_ws['A1'] = "COURSE REGISTRATION VALIDATION REPORT"
-        summary_ws['A1'].font = Font(bold=True, size=14)
-        summary_ws['A2'] = f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        
-        summary_ws['A4'] = "STUDENT INFORMATION"
-        summary_ws['A4'].font = Font(bold=True)
-        summary_ws['A5'] = "Student ID:"
-        summary_ws['B5'] = student_info.get('id', 'Unknown')
-        summary_ws['A6'] = "Name:"
-        summary_ws['B6'] = student_info.get('name', 'Unknown')
-        summary_ws['A7'] = "Field of Study:"
-        summary_ws['B7'] = student_info.get('field_of_study', 'Unknown')
-        summary_ws['A8'] = "Date of Admission:"
-        summary_ws['B8'] = student_info.get('date_admission', 'Unknown')
+        summary_rows = [
+            (["COURSE REGISTRATION VALIDATION REPORT"], Font(bold=True, size=14)),
+            ([f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"], None),
+            ([], None),
+            (["STUDENT INFORMATION"], bold_font),
+            (["Student ID:", student_info.get('id', 'Unknown')], None),
+            (["Name:", student_info.get('name', 'Unknown')], None),
+            (["Field of Study:", student_info.get('field_of_study', 'Unknown')], None),
+            (["Date of Admission:", student_info.get('date_admission', 'Unknown')], None),
+            ([], None),
+        ]
         
         # Validation Summary
-        invalid_count = len([r for r in validation_results if not r.get("is_valid", True)])
-        summary_ws['A10'] = "VALIDATION SUMMARY"
-        summary_ws['A10'].font = Font(bold=True)
-        summary_ws['A11'] = "Semesters Analyzed:"
-        summary_ws['B11'] = len(semesters)
-        summary_ws['A12'] = "Registrations Checked:"
-        summary_ws['B12'] = len(validation_results)
-        summary_ws['A13'] = "Invalid Registrations:"
-        summary_ws['B13'] = invalid_count
+        invalid_count = sum(1 for r in validation_results if not r.get("is_valid", True))
+        summary_rows.extend([
+            (["VALIDATION SUMMARY"], bold_font),
+            (["Semesters Analyzed:", len(semesters)], None),
+            (["Registrations Checked:", len(validation_results)], None),
+            (["Invalid Registrations:", invalid_count], None),
+            ([], None),
+        ])
         
         # Semester Details with GPA calculations
-        summary_ws['A15'] = "SEMESTER DETAILS"
-        summary_ws['A15'].font = Font(bold=True)
-        
-        current_row = 17
+        summary_rows.append((["SEMESTER DETAILS"], bold_font))
+        summary_rows.append(([], None))
         
         for i, semester in enumerate(semesters):
             # Semester header
             semester_name = semester.get("semester", f"Semester {i+1}")
-            summary_ws.cell(row=current_row, column=1, value=semester_name).font = Font(bold=True)
-            current_row += 1
+            summary_rows.append(([semester_name], bold_font))
             
             # Total credits
             total_credits = semester.get("total_credits", 0)
-            summary_ws.cell(row=current_row, column=1, value=f"Total Credits: {total_credits}")
-            current_row += 1
+            summary_rows.append(([f"Total Credits: {total_credits}"], None))
             
             # Calculate GPAs
             semester_courses = semester.get("courses", [])
@@ -214,8 +256,7 @@ def save_validation_report_excel(student_info, semesters, validation_results, fi
             overall_cum_gpa = calculate_cumulative_gpa(semesters, i)
             
             # Overall GPA row
-            summary_ws.cell(row=current_row, column=1, value=f"Overall - Semester GPA: {overall_sem_gpa}, Cumulative GPA: {overall_cum_gpa}")
-            current_row += 1
+            summary_rows.append(([f"Overall - Semester GPA: {overall_sem_gpa}, Cumulative GPA: {overall_cum_gpa}"], None))
             
             # Check if this semester has invalid courses
             semester_invalid_courses = [r for r in validation_results 
@@ -231,65 +272,61 @@ def save_validation_report_excel(student_info, semesters, validation_results, fi
                 valid_sem_gpa = calculate_gpa(valid_courses)
                 valid_cum_gpa = calculate_cumulative_gpa(semesters, i, valid_only=True)
                 
-                summary_ws.cell(row=current_row, column=1, value=f"Valid only - Semester GPA: {valid_sem_gpa}, Cumulative GPA: {valid_cum_gpa}")
-                current_row += 1
+                summary_rows.append(([f"Valid only - Semester GPA: {valid_sem_gpa}, Cumulative GPA: {valid_cum_gpa}"], None))
             
-            current_row += 1  # Empty line between semesters
+            summary_rows.append(([], None))  # Empty line between semesters
+        
+        summary_widths = []
+        for values, _ in summary_rows:
+            update_widths(summary_widths, values)
+        set_column_widths(summary_ws, summary_widths)
+        
+        for values, font in summary_rows:
+            if font and values:
+                values = [styled_cell(summary_ws, values[0], font=font)] + values[1:]
+            summary_ws.append(values)
         
         # Detailed Results Sheet
-        details_ws = wb.create_sheet("Detailed Results")
+        headers = ["Semester", "Course Code", "Course Name", "Grade", "Credits", "Valid", "Issue Type", "Reason"]
+        
+        # Credits from semester data, keeping the first match per semester
+        course_credits = {}
+        for semester_idx, semester in enumerate(semesters):
+            for course in semester.get("courses", []):
+                course_credits.setdefault((semester_idx, course.get("code")), course.get("credits", ""))
+        
+        def detail_rows():
+            """Yield (is_valid, row values) for each validation result."""
+            for result in validation_results:
+                is_valid = result.get("is_valid", True)
+                credits = course_credits.get((result.get("semester_index", -1), result.get("course_code")), "")
+                yield is_valid, [
+                    result.get("semester", ""),
+                    result.get("course_code", ""),
+                    result.get("course_name", ""),
+                    result.get("grade", ""),
+                    credits,
+                    "Yes" if is_valid else "No",
+                    result.get("type", ""),
+                    result.get("reason", "")
+                ]
+        
+        # First pass only measures column widths; rows are regenerated when
+        # written rather than kept in memory
+        details_widths = []
+        update_widths(details_widths, headers)
+        for _, values in detail_rows():
+            update_widths(details_widths, values)
+        set_column_widths(details_ws, details_widths)
         
         # Headers
-        headers = ["Semester", "Course Code", "Course Name", "Grade", "Credits", "Valid", "Issue Type", "Reason"]
-        for col_num, header in enumerate(headers, 1):
-            cell = details_ws.cell(row=1, column=col_num)
-            cell.value = header
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
-        
-        # Data rows
-        row_num = 2
-        for result in validation_results:
-            is_valid = result.get("is_valid", True)
-            
-            details_ws.cell(row=row_num, column=1, value=result.get("semester", ""))
-            details_ws.cell(row=row_num, column=2, value=result.get("course_code", ""))
-            details_ws.cell(row=row_num, column=3, value=result.get("course_name", ""))
-            details_ws.cell(row=row_num, column=4, value=result.get("grade", ""))
-            
-            # Get credits from semester data
-            credits = ""
-            semester_idx = result.get("semester_index", -1)
-            if semester_idx >= 0 and semester_idx < len(semesters):
-                for course in semesters[semester_idx].get("courses", []):
-                    if course.get("code") == result.get("course_code"):
-                        credits = course.get("credits", "")
-                        break
-            
-            details_ws.cell(row=row_num, column=5, value=credits)
-            details_ws.cell(row=row_num, column=6, value="Yes" if is_valid else "No")
-            details_ws.cell(row=row_num, column=7, value=result.get("type", ""))
-            details_ws.cell(row=row_num, column=8, value=result.get("reason", ""))
-            
-            # Color invalid courses red
+        details_ws.append([styled_cell(details_ws, header, font=bold_font, fill=header_fill) for header in headers])
+        
+        # Data rows, with invalid courses colored red
+        for is_valid, values in detail_rows():
             if not is_valid:
-                for col in range(1, 9):
-                    details_ws.cell(row=row_num, column=col).fill = PatternFill(start_color="FFCCCC", end_color="FFCCCC", fill_type="solid")
-            
-            row_num += 1
-        
-        # Auto-adjust column widths for both sheets
-        for ws in [summary_ws, details_ws]:
-            for column in ws.columns:
-                max_length = 0
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                ws.column_dimensions[column[0].column_letter].width = adjusted_width
+                values = [styled_cell(details_ws, value, fill=invalid_fill) for value in values]
+            details_ws.append(values)
         
         wb.save(file_path)
         logger.info(f"Saved validation report to Excel: {file_path}")
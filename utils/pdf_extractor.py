@@ -9,6 +9,43 @@ from datetime import datetime
 
 logger = logging.getLogger("pdf_extractor")
 
+# Patterns are compiled once at import time since they run for every
+# line of every transcript
+_STUDENT_ID_RE = re.compile(r'Student No\s*(\d+)')
+_STUDENT_NAME_RE = re.compile(r'Name\s+(.*?)(?=Field of Study|Date of Admission|\n|$)')
+_FIELD_OF_STUDY_RE = re.compile(r'Field of Study\s+(.*?)(?=Date of Admission|\n|$)')
+_DATE_ADMISSION_RE = re.compile(r'Date of Admission\s+(.*?)(?:\n|$)')
+
+# More flexible semester patterns
+_SEMESTER_PATTERNS = [
+    re.compile(r'(First|Second)\s*Semester\s*(\d{4})', re.IGNORECASE),     # Handles missing spaces
+    re.compile(r'Summer\s*Session\s*(\d{4})', re.IGNORECASE),              # Summer with flexible spacing
+    re.compile(r'(First|Second|Summer)\s*(\d{4})', re.IGNORECASE)           # Alternative format
+]
+
+# Improved course pattern - more flexible with spacing
+_COURSE_PATTERNS = [
+    # Try original pattern first
+    re.compile(r'(\d{8})\s+([\w\s&\'\-\+\.\,\/\(\)]+?)\s+([A-Z\+\-]+)\s+(\d+)'),
+    # Pattern with flexible spacing
+    re.compile(r'(\d{8})\s*([\w\s&\'\-\+\.\,\/\(\)]+?)\s*([A-Z\+\-]+)\s*(\d+)'),
+    # Pattern for concatenated text
+    re.compile(r'(\d{8})([A-Za-z][^0-9]*?)([A-Z\+\-]+)(\d+)')
+]
+
+_GPA_RE = re.compile(r'sem\.\s*G\.P\.A\.\s*=\s*(\d+\.\d+).*?cum\.\s*G\.P\.A\.\s*=\s*(\d+\.\d+)', re.IGNORECASE)
+_YEAR_RE = re.compile(r'\d{4}')
+_COURSE_CODE_RE = re.compile(r'(\d{8})')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Preprocessing fixes for common PyPDF2 spacing issues
+_SEMESTER_SPACING_RE = re.compile(r'(First|Second)Semester')
+_SUMMER_SPACING_RE = re.compile(r'SummerSession')
+_CODE_SPACING_RE = re.compile(r'(\d{8})([A-Za-z])')
+
+# Read-ahead buffer for PDF files; PyPDF2 issues many small reads
+PDF_READ_BUFFER_SIZE = 1024 * 1024
+
 class PDFExtractor:
     """Class for extracting and processing text from PDF transcripts."""
     
@@ -21,34 +58,49 @@ class PDFExtractor:
         Extract text content from PDF file.
         
         Args:
-            pdf_path: Path to the PDF file
+            pdf_path: Path to the PDF file, or an open binary file object
             
         Returns:
             Extracted text as a string
         """
         try:
-            all_text = []
-            
-            with open(pdf_path, 'rb') as file:
-                reader = PyPDF2.PdfReader(file)
-                
-                for page in reader.pages:
-                    # Extract text from the page
-                    page_text = page.extract_text()
-                    
-                    # Skip pages with no text content
-                    if not page_text or page_text.strip() == "":
-                        continue
-                    
-                    all_text.append(page_text)
+            # Callers may pass an already opened file; leave closing to them
+            if hasattr(pdf_path, 'read'):
+                return self._extract_text(pdf_path)
             
-            # Join all text
-            return "\n".join(all_text)
+            with open(pdf_path, 'rb', buffering=PDF_READ_BUFFER_SIZE) as file:
+                return self._extract_text(file)
         
         except Exception as e:
             logger.error(f"Error extracting text from {pdf_path}: {e}")
             return ""
     
+    def _extract_text(self, file):
+        """
+        Extract text content from an open PDF file.
+        
+        Args:
+            file: Binary file object positioned at the start of the PDF
+            
+        Returns:
+            Extracted text as a string
+        """
+        all_text = []
+        reader = PyPDF2.PdfReader(file)
+        
+        for page in reader.pages:
+            # Extract text from the page
+            page_text = page.extract_text()
+            
+            # Skip pages with no text content
+            if not page_text or page_text.strip() == "":
+                continue
+            
+            all_text.append(page_text)
+        
+        # Join all text
+        return "\n".join(all_text)
+    
     def extract_student_info(self, text):
             """
             Extract student information from the extracted text.
@@ -61,25 +113,25 @@ class PDFExtractor:
             """
             # Extract student ID
             student_id = "Unknown"
-            id_match = re.search(r'Student No\s*(\d+)', text)
+            id_match = _STUDENT_ID_RE.search(text)
             if id_match:
                 student_id = id_match.group(1).strip()
             
             # Extract name - stop at "Field of Study" 
             student_name = "Unknown"
-            name_match = re.search(r'Name\s+(.*?)(?=Field of Study|Date of Admission|\n|$)', text)
+            name_match = _STUDENT_NAME_RE.search(text)
             if name_match:
                 student_name = name_match.group(1).strip()
             
             # Extract field of study
             field_of_study = "Unknown"
-            field_match = re.search(r'Field of Study\s+(.*?)(?=Date of Admission|\n|$)', text)
+            field_match = _FIELD_OF_STUDY_RE.search(text)
             if field_match:
                 field_of_study = field_match.group(1).strip()
             
             # Extract date of admission
             date_admission = "Unknown"
-            date_match = re.search(r'Date of Admission\s+(.*?)(?:\n|$)', text)
+            date_match = _DATE_ADMISSION_RE.search(text)
             if date_match:
                 date_admission = date_match.group(1).strip()
             
@@ -94,29 +146,10 @@ class PDFExtractor:
         """
         Extract semester data from the extracted text (improved version).
         """
-        # More flexible patterns
-        semester_patterns = [
-            r'(First|Second)\s*Semester\s*(\d{4})',     # Handles missing spaces
-            r'Summer\s*Session\s*(\d{4})',              # Summer with flexible spacing
-            r'(First|Second|Summer)\s*(\d{4})'          # Alternative format
-        ]
-        
-        # Improved course pattern - more flexible with spacing
-        course_patterns = [
-            # Try original pattern first
-            r'(\d{8})\s+([\w\s&\'\-\+\.\,\/\(\)]+?)\s+([A-Z\+\-]+)\s+(\d+)',
-            # Pattern with flexible spacing
-            r'(\d{8})\s*([\w\s&\'\-\+\.\,\/\(\)]+?)\s*([A-Z\+\-]+)\s*(\d+)',
-            # Pattern for concatenated text
-            r'(\d{8})([A-Za-z][^0-9]*?)([A-Z\+\-]+)(\d+)'
-        ]
-        
-        gpa_pattern = r'sem\.\s*G\.P\.A\.\s*=\s*(\d+\.\d+).*?cum\.\s*G\.P\.A\.\s*=\s*(\d+\.\d+)'
-        
         # Preprocessing - fix common spacing issues
-        text = re.sub(r'(First|Second)Semester', r'\1 Semester', text)
-        text = re.sub(r'SummerSession', r'Summer Session', text)
-        text = re.sub(r'(\d{8})([A-Za-z])', r'\1 \2', text)  # Add space after course code
+        text = _SEMESTER_SPACING_RE.sub(r'\1 Semester', text)
+        text = _SUMMER_SPACING_RE.sub(r'Summer Session', text)
+        text = _CODE_SPACING_RE.sub(r'\1 \2', text)  # Add space after course code
         
         # Debug: Log first 500 chars of processed text
         logger.debug(f"Processing text (first 500 chars): {text[:500]}")
@@ -131,13 +164,16 @@ class PDFExtractor:
             line = line.strip()
             
             # Skip empty lines and URLs
-            if not line or "http" in line.lower() or ".php" in line.lower():
+            if not line:
+                continue
+            line_lower = line.lower()
+            if "http" in line_lower or ".php" in line_lower:
                 continue
             
             # Try semester patterns
             semester_found = False
-            for pattern_num, pattern in enumerate(semester_patterns):
-                semester_match = re.search(pattern, line, re.IGNORECASE)
+            for pattern in _SEMESTER_PATTERNS:
+                semester_match = pattern.search(line)
                 if semester_match:
                     logger.debug(f"Found semester on line {line_num}: {line}")
                     
@@ -161,7 +197,7 @@ class PDFExtractor:
                         else:
                             # Extract from the full match
                             full_match = semester_match.group(0)
-                            year_match = re.search(r'\d{4}', full_match)
+                            year_match = _YEAR_RE.search(full_match)
                             year = year_match.group(0) if year_match else "Unknown"
                             semester_type = "First" if "First" in full_match else ("Second" if "Second" in full_match else "Unknown")
                     
@@ -185,7 +221,7 @@ class PDFExtractor:
                 continue
             
             # Try GPA pattern
-            gpa_match = re.search(gpa_pattern, line, re.IGNORECASE)
+            gpa_match = _GPA_RE.search(line)
             if gpa_match and current_semester:
                 try:
                     current_semester["sem_gpa"] = float(gpa_match.group(1))
@@ -198,8 +234,8 @@ class PDFExtractor:
             # Try course patterns
             if current_semester:
                 course_found = False
-                for pattern_num, pattern in enumerate(course_patterns):
-                    course_match = re.search(pattern, line)
+                for pattern in _COURSE_PATTERNS:
+                    course_match = pattern.search(line)
                     if course_match:
                         try:
                             groups = course_match.groups()
@@ -209,7 +245,7 @@ class PDFExtractor:
                             credits_str = groups[3] if len(groups) > 3 else "0"
                             
                             # Clean up course name
-                            course_name = re.sub(r'\s+', ' ', course_name)
+                            course_name = _WHITESPACE_RE.sub(' ', course_name)
                             
                             # Parse credits
                             credits = int(credits_str) if credits_str.isdigit() else 0
@@ -237,7 +273,7 @@ class PDFExtractor:
                 
                 if not course_found:
                     # Try to find course codes even if full pattern doesn't match
-                    code_match = re.search(r'(\d{8})', line)
+                    code_match = _COURSE_CODE_RE.search(line)
                     if code_match:
                         logger.debug(f"Found course code but couldn't parse full line: {line}")
         
@@ -257,7 +293,7 @@ class PDFExtractor:
         Process a PDF transcript and extract all data.
         
         Args:
-            pdf_path: Path to the PDF file
+            pdf_path: Path to the PDF file, or an open binary file object
             text: Optional pre-extracted text (used instead of extracting from PDF)
             
         Returns:
@@ -25,6 +25,9 @@ class ValidationAdapter:
         self.validator_module = None
         self.validator = None
         
+        # (path, mtime) of the course data the validator was built from
+        self._course_data_key = None
+        
         # Try to load the validator module
         self.load_validator_module()
     
@@ -58,6 +61,9 @@ class ValidationAdapter:
         
         Args:
             course_data_path: Path to the course data file
+            
+        Returns:
+            True if the validator is ready, False otherwise
         """
         if self.validator_module is None:
             if not self.load_validator_module():
@@ -69,8 +75,19 @@ class ValidationAdapter:
                 config.current_course_data if config.current_course_data else 
                 config.default_course_data)
             
+            # Reuse the validator if the course data file hasn't changed
+            try:
+                course_data_key = (str(course_data_path), os.path.getmtime(course_data_path))
+            except OSError:
+                course_data_key = None
+            
+            if self.validator is not None and course_data_key is not None and course_data_key == self._course_data_key:
+                logger.debug(f"Validator already initialized with {course_data_path}")
+                return True
+            
             # Initialize the validator
             self.validator = self.validator_module.CourseRegistrationValidator(str(course_data_path))
+            self._course_data_key = course_data_key
             logger.info(f"Initialized validator with course data from {course_data_path}")
             return True
         